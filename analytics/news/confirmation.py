@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from typing import Dict, Any, Set
+from typing import Dict, Any, Iterable, Set
 
 from .source_weights import weight_for_source
 
@@ -24,6 +24,33 @@ def confirmed_risk_tags(
         if weight_for_source(src) >= credibility_threshold:
             tag_sources[tag].add(src)
 
+    return _confirmed(tag_sources, min_confirmations)
+
+def confirmed_risk_tags_cols(
+    cols: Dict[str, Iterable[str]],
+    min_confirmations: int = 2,
+    credibility_threshold: float = 1.5
+) -> Dict[str, Any]:
+    """
+    Column-oriented twin of confirmed_risk_tags: takes {"risk_tag": [...], "source": [...]}
+    (already stripped; tags upper-cased, sources lower-cased) so callers holding a DataFrame
+    don't have to build one dict per row.
+    """
+    tag_sources: Dict[str, Set[str]] = defaultdict(set)
+    weights: Dict[str, float] = {}
+
+    for tag, src in zip(cols["risk_tag"], cols["source"]):
+        if not tag or tag == "OTHER":
+            continue
+        w = weights.get(src)
+        if w is None:
+            w = weights[src] = weight_for_source(src)
+        if w >= credibility_threshold:
+            tag_sources[tag].add(src)
+
+    return _confirmed(tag_sources, min_confirmations)
+
+def _confirmed(tag_sources: Dict[str, Set[str]], min_confirmations: int) -> Dict[str, Any]:
     confirmed = {}
     for tag, srcs in tag_sources.items():
         if len(srcs) >= min_confirmations:
@@ -15,24 +15,29 @@ def build_evidence_table(news_df: pd.DataFrame, ticker: str, days: int = 30, max
     if news_df is None or news_df.empty:
         return pd.DataFrame(columns=["published_at", "ticker", "source", "risk_tag", "impact_score", "title", "url"])
 
-    df = news_df.copy()
-    df["ticker"] = df["ticker"].astype(str).str.upper()
-    df = df[df["ticker"] == ticker.upper()].copy()
-
-    df["published_at"] = pd.to_datetime(df["published_at"], errors="coerce", utc=True)
+    # ticker + recency masks first, then a single copy of the surviving rows
+    tickers = news_df["ticker"].astype(str).str.upper()
+    in_ticker = tickers == ticker.upper()
+    published = pd.to_datetime(news_df.loc[in_ticker, "published_at"], errors="coerce", utc=True)
     cutoff = pd.Timestamp.utcnow() - pd.Timedelta(days=days)
-    df = df[df["published_at"] >= cutoff].copy()
+    keep = published.index[published >= cutoff]
+
+    df = news_df.loc[keep].copy()
+    df["ticker"] = tickers[keep]
+    df["published_at"] = published[keep]
 
     df["impact_score"] = pd.to_numeric(df["impact_score"], errors="coerce").fillna(0).astype(int)
-    df["risk_tag"] = df["risk_tag"].astype(str).fillna("OTHER")
-    df["source"] = df["source"].astype(str).fillna("unknown")
-    df["title"] = df["title"].astype(str).fillna("")
-    df["url"] = df["url"].astype(str).fillna("")
+    df["risk_tag"] = df["risk_tag"].fillna("OTHER").astype(str)
+    df["source"] = df["source"].fillna("unknown").astype(str)
+    df["title"] = df["title"].fillna("").astype(str)
+    df["url"] = df["url"].fillna("").astype(str)
 
-    # Put worst first, then newest
-    df = df.sort_values(["impact_score", "published_at"], ascending=[True, False])
+    # Put worst first, then newest. Both keys ascending (age instead of timestamp)
+    # so nsmallest can heap-select max_rows instead of sorting every row.
+    df["_age"] = cutoff - df["published_at"]
+    df = df.nsmallest(max_rows, ["impact_score", "_age"], keep="first")
 
-    keep = df[["published_at", "ticker", "source", "risk_tag", "impact_score", "title", "url"]].head(max_rows).copy()
+    keep = df[["published_at", "ticker", "source", "risk_tag", "impact_score", "title", "url"]].copy()
     keep["published_at"] = keep["published_at"].dt.strftime("%Y-%m-%d %H:%M UTC")
     return keep
 
@@ -47,16 +52,11 @@ def write_evidence_html(evidence_df: pd.DataFrame, out_path: Path, title: str):
         out_path.write_text(f"<html><body><h2>{title}</h2><p>No evidence rows.</p></body></html>", encoding="utf-8")
         return
 
-    # Make title clickable
-    def linkify(row):
-        u = row.get("url", "")
-        t = row.get("title", "")
-        if u and u != "None":
-            return f'<a href="{u}" target="_blank" rel="noopener noreferrer">{t}</a>'
-        return t
-
+    # Make title clickable (whole-column string concat, no per-row apply)
     df = evidence_df.copy()
-    df["title"] = df.apply(linkify, axis=1)
+    u = df["url"].astype(str)
+    linked = '<a href="' + u + '" target="_blank" rel="noopener noreferrer">' + df["title"].astype(str) + "</a>"
+    df["title"] = linked.where(~u.isin(["", "None"]), df["title"])
 
     html_table = df.to_html(index=False, escape=False)
 
@@ -6,7 +6,7 @@ from typing import List, Optional
 import pandas as pd
 
 from .schema import NewsItem
-from .utils import make_dedupe_key
+from .utils import make_dedupe_keys
 from .scoring import score_and_tag
 
 from .sources.sec import fetch_sec_filings
@@ -66,20 +66,14 @@ def run_news_pipeline(
     # Tag + score
     items = score_and_tag(items)
 
-    # Dedupe
-    seen = set()
-    deduped: List[NewsItem] = []
-    for it in items:
-        it.dedupe_key = make_dedupe_key(it.ticker, it.published_at, it.title)
-        if it.dedupe_key in seen:
-            continue
-        seen.add(it.dedupe_key)
-        deduped.append(it)
-
-    df = pd.DataFrame([it.to_dict() for it in deduped])
+    df = pd.DataFrame([it.to_dict() for it in items])
     if df.empty:
         return df
 
+    # Dedupe (titles normalized column-wise, first occurrence wins)
+    df["dedupe_key"] = make_dedupe_keys(df["ticker"], df["published_at"], df["title"])
+    df = df.drop_duplicates(subset=["dedupe_key"], keep="first")
+
     # Types
     df["published_at"] = df["published_at"].astype(str)
     df["ticker"] = df["ticker"].astype(str).str.upper()
@@ -25,7 +25,7 @@ def build_news_risk_dashboard(news_df: pd.DataFrame, days_short: int = 7, days_l
     df = news_df.copy()
     df["published_at"] = pd.to_datetime(df["published_at"], errors="coerce", utc=True)
     df["ticker"] = df["ticker"].astype(str).str.upper()
-    df["risk_tag"] = df["risk_tag"].astype(str).fillna("OTHER")
+    df["risk_tag"] = df["risk_tag"].fillna("OTHER").astype(str)
     df["impact_score"] = pd.to_numeric(df["impact_score"], errors="coerce").fillna(0).astype(float)
 
     now = pd.Timestamp.utcnow()
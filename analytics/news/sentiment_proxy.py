@@ -46,7 +46,7 @@ def build_news_sentiment_proxy(news_df: pd.DataFrame) -> pd.DataFrame:
 
     df = news_df.copy()
     df["ticker"] = df["ticker"].astype(str).str.upper()
-    df["title"] = df["title"].astype(str).fillna("")
+    df["title"] = df["title"].fillna("").astype(str)
     df["impact_score"] = pd.to_numeric(df["impact_score"], errors="coerce").fillna(0).astype(int)
     df["published_at"] = pd.to_datetime(df["published_at"], errors="coerce", utc=True)
 
@@ -5,16 +5,22 @@ import re
 from datetime import datetime, timezone
 from typing import Optional
 
+import pandas as pd
 
-_WS = re.compile(r"\s+")
-_PUNCT = re.compile(r"[^\w\s]")
+
+# punctuation ([^\w\s]) and whitespace (\s) together are exactly \W, so one
+# pass over runs of either replaces the old punct-then-whitespace pair
+_NON_WORD = re.compile(r"\W+")
 
 
 def normalize_title(title: str) -> str:
-    t = (title or "").strip().lower()
-    t = _PUNCT.sub(" ", t)
-    t = _WS.sub(" ", t).strip()
-    return t
+    return _NON_WORD.sub(" ", (title or "").lower()).strip()
+
+
+def normalize_titles(titles: pd.Series) -> pd.Series:
+    """Column version of normalize_title: same patterns, run by pandas' .str kernels."""
+    t = titles.fillna("").astype(str).str.lower()
+    return t.str.replace(_NON_WORD, " ", regex=True).str.strip()
 
 
 def date_bucket(iso_dt: str) -> str:
@@ -29,6 +35,20 @@ def make_dedupe_key(ticker: str, iso_dt: str, title: str) -> str:
     return hashlib.sha1(base.encode("utf-8")).hexdigest()
 
 
+def make_dedupe_keys(tickers: pd.Series, published_at: pd.Series, titles: pd.Series) -> pd.Series:
+    """make_dedupe_key over whole columns; only the sha1 itself stays per row."""
+    base = (
+        tickers.fillna("").astype(str).str.upper()
+        + "|" + published_at.astype(str).str[:10]
+        + "|" + normalize_titles(titles)
+    )
+    return pd.Series(
+        [hashlib.sha1(b.encode("utf-8")).hexdigest() for b in base],
+        index=base.index,
+        dtype=object,
+    )
+
+
 def parse_iso_datetime(s: str) -> Optional[str]:
     """
     Best-effort parse various datetime formats into ISO (UTC if naive).
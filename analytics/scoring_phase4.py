@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import json
+import re
 from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
@@ -103,18 +105,33 @@ def _extract_domain(url: str) -> str:
         return ""
 
 
-def _load_whitelist_domains(root: Path) -> set:
+_DOMAIN_RE = re.compile(r"^https?://(?:www\.)?([^/?#]*)")
+
+
+def _vec_extract_domain(urls: pd.Series) -> pd.Series:
+    """Vectorized _extract_domain over a URL column."""
+    return urls.astype(str).str.strip().str.lower().str.extract(_DOMAIN_RE, expand=False).fillna("")
+
+
+def _load_whitelist_domains(root: Path) -> frozenset:
     """
     Reads export/source_whitelist.csv if present.
     Expected columns could be: domain, tier, allow, notes (we're flexible)
+    Returns a frozenset so callers can hash-match a whole column with isin().
     """
     wl_path = root / "export" / "source_whitelist.csv"
     if not wl_path.exists():
-        return set()
+        return frozenset()
+    return _load_whitelist_cached(str(wl_path), wl_path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=4)
+def _load_whitelist_cached(path: str, mtime_ns: int) -> frozenset:
+    # keyed on mtime: repeat calls reuse the parsed set until the CSV changes
     try:
-        df = pd.read_csv(wl_path)
+        df = pd.read_csv(path)
     except Exception:
-        return set()
+        return frozenset()
 
     # Accept "domain" or "source" column
     col = None
@@ -123,16 +140,10 @@ def _load_whitelist_domains(root: Path) -> set:
             col = c
             break
     if col is None:
-        return set()
+        return frozenset()
 
-    domains = set()
-    for x in df[col].astype(str).fillna("").tolist():
-        d = x.strip().lower()
-        if d.startswith("www."):
-            d = d[4:]
-        if d:
-            domains.add(d)
-    return domains
+    d = df[col].fillna("").astype(str).str.strip().str.lower().str.removeprefix("www.")
+    return frozenset(d[d != ""])
 
 
 def compute_data_completeness(inputs: Dict[str, Any]) -> Tuple[int, List[str]]:
@@ -194,7 +205,7 @@ def compute_confidence_veracity(
     # Normalize fields
     df["source"] = df.get("source", "unknown").astype(str).str.lower()
     df["url"] = df.get("url", "").astype(str)
-    df["domain"] = df["url"].apply(_extract_domain)
+    df["domain"] = _vec_extract_domain(df["url"])
 
     # Source mix
     source_counts = df["source"].value_counts(dropna=False).to_dict()
@@ -103,6 +103,13 @@ def domain_of(url: str) -> str:
     except Exception:
         return ""
 
+# netloc as urlparse sees it: everything between "//" and the next / ? #
+_NETLOC_RE = re.compile(r"^(?:[a-z][a-z0-9+.\-]*:)?//([^/?#]*)")
+
+def domains_of(urls: pd.Series) -> pd.Series:
+    """Column version of domain_of: one compiled regex run by pandas' .str kernels."""
+    return urls.astype(str).str.lstrip().str.lower().str.extract(_NETLOC_RE, expand=False).fillna("")
+
 def load_whitelist_domains() -> set[str]:
     wl = REPO_ROOT / "export" / "source_whitelist.csv"
     if not wl.exists():
@@ -115,17 +122,21 @@ def load_whitelist_domains() -> set[str]:
     except Exception:
         return set()
 
+_SOURCE_WEIGHTS = {
+    "sec": 3.0,
+    "reuters": 2.5, "bloomberg": 2.5, "wsj": 2.5, "ft": 2.5,
+    "cnbc": 1.6,
+    "finnhub": 0.7,
+}
+_DEFAULT_SOURCE_WEIGHT = 0.6
+
 def source_weight(source: str) -> float:
-    s = (source or "").strip().lower()
-    if s == "sec":
-        return 3.0
-    if s in {"reuters", "bloomberg", "wsj", "ft"}:
-        return 2.5
-    if s in {"cnbc"}:
-        return 1.6
-    if s in {"finnhub"}:
-        return 0.7
-    return 0.6
+    return _SOURCE_WEIGHTS.get((source or "").strip().lower(), _DEFAULT_SOURCE_WEIGHT)
+
+def source_weights(sources: pd.Series) -> pd.Series:
+    """source_weight for a whole column: one dict lookup per row via .map."""
+    s = sources.fillna("").astype(str).str.strip().str.lower()
+    return s.map(_SOURCE_WEIGHTS).fillna(_DEFAULT_SOURCE_WEIGHT)
 
 def load_news(ticker: str) -> pd.DataFrame:
     p_clean = PROCESSED / "news_unified_clean.csv"
@@ -138,10 +149,10 @@ def load_news(ticker: str) -> pd.DataFrame:
     df = df[df["ticker"] == ticker.upper()].copy()
     if "published_at" in df.columns:
         df["published_at"] = pd.to_datetime(df["published_at"], errors="coerce", utc=True)
-    df["domain"] = df.get("url", "").apply(domain_of)
+    df["domain"] = domains_of(df["url"]) if "url" in df.columns else ""
     wl = load_whitelist_domains()
     df["whitelisted"] = df["domain"].isin(wl)
-    df["src_weight"] = df.get("source", "").apply(source_weight)
+    df["src_weight"] = source_weights(df["source"]) if "source" in df.columns else _DEFAULT_SOURCE_WEIGHT
     # trust score: source baseline + whitelist bump
     df["trust_score"] = df["src_weight"] + df["whitelisted"].astype(int) * 0.5
     return df
@@ -390,7 +401,7 @@ def bull_bear_evidence(news: pd.DataFrame, tag: Optional[str], top_n: int = 4):
 
     return pack(bull), pack(bear)
 
-def build_html(ticker: str, thesis: dict, items: list[dict]) -> str:
+def build_html(ticker: str, thesis: dict, items: list[dict], generated: Optional[str] = None) -> str:
     thesis_name = escape(str(thesis.get("name") or f"{ticker} thesis"))
     desc = escape(str(thesis.get("description") or ""))
 
@@ -469,7 +480,7 @@ def build_html(ticker: str, thesis: dict, items: list[dict]) -> str:
   <h1>🪓 Stormbreaker Claim Evidence — {escape(ticker)}</h1>
   <p><b>Thesis:</b> {thesis_name}</p>
   <p>{desc}</p>
-  <p style="color:#666;">Generated {escape(utc_now())}</p>
+  <p style="color:#666;">Generated {escape(generated or utc_now())}</p>
   <hr style="border:none;border-top:1px solid #eee;margin:18px 0;">
   {''.join(blocks)}
 </body>
@@ -516,15 +527,17 @@ def main(ticker: str, thesis_path: str):
     out_json = OUTPUTS / f"claim_evidence_{ticker.upper()}.json"
     out_html = OUTPUTS / f"claim_evidence_{ticker.upper()}.html"
 
+    # one timestamp for both artifacts
+    generated = utc_now()
     payload = _deep_json_safe({
-        "as_of": utc_now(),
+        "as_of": generated,
         "ticker": ticker.upper(),
         "thesis": thesis.get("name"),
         "thesis_file": str(thesis_path),
         "results": results
     })
     out_json.write_text(json.dumps(payload, indent=2), encoding="utf-8")
-    out_html.write_text(build_html(ticker.upper(), thesis, results), encoding="utf-8")
+    out_html.write_text(build_html(ticker.upper(), thesis, results, generated), encoding="utf-8")
 
     print(f"DONE ✅ claim evidence: {out_json}")
     print(f"DONE ✅ claim evidence html: {out_html}")
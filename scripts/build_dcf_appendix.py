@@ -1,10 +1,15 @@
 #!/usr/bin/env python3
-import argparse, json, math, subprocess
+import argparse, io, json, math, shutil, subprocess
 from pathlib import Path
 from datetime import datetime, timezone
 
+import numpy as np
 import pandas as pd
 from docx import Document
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+from docx.shared import Emu
+from xml.sax.saxutils import escape as xml_escape
 
 REPO = Path(__file__).resolve().parents[1]
 DATA = REPO / "data" / "processed"
@@ -37,12 +42,7 @@ def safe_float(v):
 
 def dcf_fcff(rev0, rev_cagr, fcf_margin, years, wacc, terminal_g):
     # Project revenue and FCF directly (simple + stable)
-    rev = []
-    fcf = []
-    for t in range(1, years+1):
-        rt = rev0 * ((1.0 + rev_cagr) ** t)
-        rev.append(rt)
-        fcf.append(rt * fcf_margin)
+    fcf = [rev0 * ((1.0 + rev_cagr) ** t) * fcf_margin for t in range(1, years+1)]
 
     pv = 0.0
     for t, cf in enumerate(fcf, start=1):
@@ -61,13 +61,38 @@ def dcf_fcff(rev0, rev_cagr, fcf_margin, years, wacc, terminal_g):
     ev = pv + pv_tv
     return {"pv_cf": pv, "tv": tv, "pv_tv": pv_tv, "ev": ev}
 
+def _dcf_grid(rev0, rev_cagr, fcf_margin, years, wacc_arr, g_arr):
+    # EV for every (wacc, g) pair in one pass; NaN where wacc <= g (no terminal value)
+    ev = np.full((wacc_arr.size, g_arr.size), np.nan)
+    fcf = np.empty(years)
+    for t in range(years):
+        fcf[t] = rev0 * ((1.0 + rev_cagr) ** (t + 1)) * fcf_margin
+
+    for i in range(wacc_arr.size):
+        w = wacc_arr[i]
+        pv = 0.0
+        for t in range(years):
+            pv += fcf[t] / ((1.0 + w) ** (t + 1))
+        for j in range(g_arr.size):
+            g = g_arr[j]
+            if w <= g:
+                continue
+            tv = (fcf[years - 1] * (1.0 + g)) / (w - g)
+            ev[i, j] = pv + tv / ((1.0 + w) ** years)
+    return ev
+
 def render_sensitivity(rev0, fcf_margin, years, wacc_grid, g_grid):
+    # use base rev_cagr for grid
+    ev = _dcf_grid(
+        float(rev0), 0.10, float(fcf_margin), int(years),
+        np.asarray(wacc_grid, dtype=np.float64), np.asarray(g_grid, dtype=np.float64),
+    )
     rows = []
-    for w in wacc_grid:
+    for i, w in enumerate(wacc_grid):
         row = {"WACC": pct(w)}
-        for g in g_grid:
-            r = dcf_fcff(rev0, 0.10, fcf_margin, years, w, g)  # use base rev_cagr for grid
-            row[f"g={pct(g)}"] = money(r["ev"]) if r["ev"] is not None else "N/A"
+        for j, g in enumerate(g_grid):
+            v = ev[i, j]
+            row[f"g={pct(g)}"] = "N/A" if np.isnan(v) else money(float(v))
         rows.append(row)
     return pd.DataFrame(rows)
 
@@ -75,6 +100,27 @@ def doc_add_h1(doc, s): doc.add_heading(s, level=1)
 def doc_add_h2(doc, s): doc.add_heading(s, level=2)
 def doc_add_p(doc, s): doc.add_paragraph(s)
 
+def doc_add_table_xml(doc, header, rows):
+    # Build the whole table as one XML string and parse it once, instead of
+    # one python-docx/lxml round-trip per cell.
+    sec = doc.sections[-1]
+    col_w = int(Emu(sec.page_width - sec.left_margin - sec.right_margin).twips / len(header))
+
+    def tc(text):
+        run = f'<w:r><w:t xml:space="preserve">{xml_escape(text)}</w:t></w:r>' if text else ""
+        return f'<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{col_w}"/></w:tcPr><w:p>{run}</w:p></w:tc>'
+
+    xml = (
+        f"<w:tbl {nsdecls('w')}>"
+        '<w:tblPr><w:tblW w:type="auto" w:w="0"/>'
+        '<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" w:lastRow="0" w:noHBand="0" w:noVBand="1" w:val="04A0"/>'
+        "</w:tblPr>"
+        "<w:tblGrid>" + f'<w:gridCol w:w="{col_w}"/>' * len(header) + "</w:tblGrid>"
+        + "".join("<w:tr>" + "".join(tc(c) for c in row) + "</w:tr>" for row in [header, *rows])
+        + "</w:tbl>"
+    )
+    doc.element.body._insert_tbl(parse_xml(xml))
+
 def main(ticker: str, assumptions_path: Path):
     ticker = ticker.upper().strip()
     snap_path = DATA / "comps_snapshot.csv"
@@ -136,39 +182,39 @@ def main(ticker: str, assumptions_path: Path):
 
     # Write MD
     md_path = OUT / f"{ticker}_DCF_Appendix.md"
-    lines = []
-    lines.append(f"# DCF Appendix — {ticker}")
-    lines.append(f"*Generated: {now}*")
-    lines.append("")
-    lines.append("## What this is (for the skeptics)")
-    lines.append("This is a **purely numbers-based** discounted cash flow (DCF) appendix.")
-    lines.append("It uses your pipeline’s **Revenue (last 12 months)** and **Free cash flow margin** to project cash flows, then discounts them back using WACC.")
-    lines.append("")
-    lines.append("## Inputs used (traceable)")
-    lines.append(f"- Revenue (last 12 months): **{money(rev0)}**  _(source: comps_snapshot → revenue_ttm)_")
-    lines.append(f"- Free cash flow margin (last 12 months): **{pct(fcf_margin)}**  _(source: comps_snapshot → fcf_margin_ttm_pct)_")
-    lines.append(f"- Market cap: **{money(market_cap)}**  _(source: comps_snapshot → market_cap)_")
-    lines.append(f"- Net debt: **{money(net_debt)}**  _(source: comps_snapshot → net_debt or debt−cash)_")
-    lines.append("")
-    lines.append("## Scenario results (enterprise value and equity value)")
-    lines.append("| Scenario | Revenue growth (per year) | Free cash flow margin | WACC | Terminal growth | Enterprise value | Equity value |")
-    lines.append("|---|---:|---:|---:|---:|---:|---:|")
+    buf = io.StringIO()
+    w = buf.write
+    w(f"# DCF Appendix — {ticker}\n")
+    w(f"*Generated: {now}*\n")
+    w("\n")
+    w("## What this is (for the skeptics)\n")
+    w("This is a **purely numbers-based** discounted cash flow (DCF) appendix.\n")
+    w("It uses your pipeline’s **Revenue (last 12 months)** and **Free cash flow margin** to project cash flows, then discounts them back using WACC.\n")
+    w("\n")
+    w("## Inputs used (traceable)\n")
+    w(f"- Revenue (last 12 months): **{money(rev0)}**  _(source: comps_snapshot → revenue_ttm)_\n")
+    w(f"- Free cash flow margin (last 12 months): **{pct(fcf_margin)}**  _(source: comps_snapshot → fcf_margin_ttm_pct)_\n")
+    w(f"- Market cap: **{money(market_cap)}**  _(source: comps_snapshot → market_cap)_\n")
+    w(f"- Net debt: **{money(net_debt)}**  _(source: comps_snapshot → net_debt or debt−cash)_\n")
+    w("\n")
+    w("## Scenario results (enterprise value and equity value)\n")
+    w("| Scenario | Revenue growth (per year) | Free cash flow margin | WACC | Terminal growth | Enterprise value | Equity value |\n")
+    w("|---|---:|---:|---:|---:|---:|---:|\n")
     for name in ["bear","base","bull"]:
         s = scenarios[name]
         o = scen_out[name]
-        lines.append(
-            f"| {name.upper()} | {pct(s['rev_cagr'])} | {pct(s['fcf_margin'])} | {pct(s['wacc'])} | {pct(s['terminal_g'])} | {money(o['ev'])} | {money(o['equity_value'])} |"
+        w(
+            f"| {name.upper()} | {pct(s['rev_cagr'])} | {pct(s['fcf_margin'])} | {pct(s['wacc'])} | {pct(s['terminal_g'])} | {money(o['ev'])} | {money(o['equity_value'])} |\n"
         )
-    lines.append("")
-    lines.append("## Sensitivity (enterprise value) — WACC × Terminal growth")
-    lines.append("")
-    lines.append(sens.to_markdown(index=False))
-    lines.append("")
-    lines.append("## Important honesty (so nobody over-trusts it)")
-    lines.append("- If the business gets hit by a **cost shock** (ex: drivers become employees), the key DCF levers are **free cash flow margin** and **WACC** (risk).")
-    lines.append("- DCF is not a truth machine. It’s a calculator: **garbage in → garbage out**, so we show the full sensitivity grid.")
-    lines.append("")
-    md_path.write_text("\n".join(lines), encoding="utf-8")
+    w("\n")
+    w("## Sensitivity (enterprise value) — WACC × Terminal growth\n")
+    w("\n")
+    w(sens.to_markdown(index=False) + "\n")
+    w("\n")
+    w("## Important honesty (so nobody over-trusts it)\n")
+    w("- If the business gets hit by a **cost shock** (ex: drivers become employees), the key DCF levers are **free cash flow margin** and **WACC** (risk).\n")
+    w("- DCF is not a truth machine. It’s a calculator: **garbage in → garbage out**, so we show the full sensitivity grid.\n")
+    md_path.write_text(buf.getvalue(), encoding="utf-8")
 
     # Write DOCX (simple but clean)
     docx_path = EXP / f"{ticker}_DCF_Appendix.docx"
@@ -187,40 +233,29 @@ def main(ticker: str, assumptions_path: Path):
     doc_add_p(doc, f"Net debt: {money(net_debt)} (source: comps_snapshot → net_debt or debt−cash)")
 
     doc_add_h2(doc, "Scenario results")
-    table = doc.add_table(rows=1, cols=7)
-    hdr = table.rows[0].cells
-    hdr[0].text = "Scenario"
-    hdr[1].text = "Revenue growth / year"
-    hdr[2].text = "Free cash flow margin"
-    hdr[3].text = "WACC"
-    hdr[4].text = "Terminal growth"
-    hdr[5].text = "Enterprise value"
-    hdr[6].text = "Equity value"
-
-    for name in ["bear","base","bull"]:
-        s = scenarios[name]
-        o = scen_out[name]
-        rowc = table.add_row().cells
-        rowc[0].text = name.upper()
-        rowc[1].text = pct(s["rev_cagr"])
-        rowc[2].text = pct(s["fcf_margin"])
-        rowc[3].text = pct(s["wacc"])
-        rowc[4].text = pct(s["terminal_g"])
-        rowc[5].text = money(o["ev"])
-        rowc[6].text = money(o["equity_value"])
+    doc_add_table_xml(
+        doc,
+        ["Scenario", "Revenue growth / year", "Free cash flow margin", "WACC", "Terminal growth", "Enterprise value", "Equity value"],
+        [
+            [
+                name.upper(),
+                pct(scenarios[name]["rev_cagr"]),
+                pct(scenarios[name]["fcf_margin"]),
+                pct(scenarios[name]["wacc"]),
+                pct(scenarios[name]["terminal_g"]),
+                money(scen_out[name]["ev"]),
+                money(scen_out[name]["equity_value"]),
+            ]
+            for name in ["bear", "base", "bull"]
+        ],
+    )
 
     doc_add_h2(doc, "Sensitivity (enterprise value) — WACC × Terminal growth")
-    sens_table = doc.add_table(rows=1, cols=1 + len(g_grid))
-    h = sens_table.rows[0].cells
-    h[0].text = "WACC"
-    for j, g in enumerate(g_grid, start=1):
-        h[j].text = f"g={pct(g)}"
-
-    for _, rr in sens.iterrows():
-        cells = sens_table.add_row().cells
-        cells[0].text = str(rr["WACC"])
-        for j, g in enumerate(g_grid, start=1):
-            cells[j].text = str(rr[f"g={pct(g)}"])
+    doc_add_table_xml(
+        doc,
+        ["WACC"] + [f"g={pct(g)}" for g in g_grid],
+        [[str(v) for v in rr] for rr in sens.itertuples(index=False)],
+    )
 
     doc_add_h2(doc, "Important honesty (so nobody over-trusts it)")
     doc_add_p(doc, "If the business gets hit by a cost shock (example: drivers become employees), the key DCF levers are free cash flow margin and WACC (risk).")
@@ -230,15 +265,16 @@ def main(ticker: str, assumptions_path: Path):
 
     # Export PDF via soffice if available
     pdf_path = EXP / f"{ticker}_DCF_Appendix.pdf"
-    soffice = None
-    for c in ["soffice", "/opt/homebrew/bin/soffice"]:
-        if Path(c).exists() or (c == "soffice"):
-            soffice = c
-            break
+    soffice = shutil.which("soffice")
+    if soffice is None and Path("/opt/homebrew/bin/soffice").exists():
+        soffice = "/opt/homebrew/bin/soffice"
 
     if soffice:
         try:
-            subprocess.run([soffice, "--headless", "--convert-to", "pdf", "--outdir", str(EXP), str(docx_path)], check=False)
+            subprocess.run(
+                [soffice, "--headless", "--convert-to", "pdf", "--outdir", str(EXP), str(docx_path)],
+                check=False, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            )
         except Exception:
             pass
 
@@ -1,9 +1,26 @@
 from __future__ import annotations
 
+import io
 import json
+import os
 from datetime import datetime, timezone
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional: stdlib json fallback
+    orjson = None
+
+
+def json_loads(data):
+    # json.dumps writes NaN/Infinity literals, which orjson rejects: reparse with stdlib json
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
 
 ROOT = Path(__file__).resolve().parents[1]
 OUTPUTS = ROOT / "outputs"
@@ -19,17 +36,32 @@ def _safe_json(path: Path) -> dict:
     if not path.exists():
         return {}
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return json_loads(path.read_bytes())
     except Exception:
         return {}
 
 
-def _exists(rel: str) -> bool:
-    return (ROOT / rel).exists()
+def _list_dirs(rels) -> dict:
+    """One scandir per parent directory instead of one stat per artifact."""
+    listing = {}
+    for parent in {str(Path(rel).parent) for rel in rels}:
+        try:
+            with os.scandir(ROOT / parent) as it:
+                listing[parent] = {e.name for e in it if e.is_file()}
+        except OSError:
+            listing[parent] = set()
+    return listing
 
 
-def _link(label: str, rel: str) -> str:
-    ok = _exists(rel)
+def _exists(rel: str, listing: dict | None = None) -> bool:
+    if listing is None:
+        return (ROOT / rel).exists()
+    p = Path(rel)
+    return p.name in listing.get(str(p.parent), ())
+
+
+def _link(label: str, rel: str, listing: dict | None = None) -> str:
+    ok = _exists(rel, listing)
     badge = "✅" if ok else "⚠️"
     href = "../" + rel
     return f'<li>{badge} <a href="{href}">{label}</a> <code>{rel}</code></li>'
@@ -70,77 +102,82 @@ def build_dashboard(ticker: str) -> Path:
     red_flags = summary.get("red_flags") or []
     bucket = summary.get("bucket_scores") or {}
 
-    html = [
-        "<!doctype html>",
-        "<html><head><meta charset='utf-8'/>",
-        f"<title>Decision Dashboard — {ticker}</title>",
-        "<style>",
-        "body{font-family:system-ui,-apple-system,Segoe UI,Roboto,Arial;max-width:980px;margin:24px auto;padding:0 12px;}",
-        "code{background:#f3f3f3;padding:2px 6px;border-radius:6px;}",
-        ".card{border:1px solid #ddd;border-radius:16px;padding:14px 16px;margin:12px 0;}",
-        "h1{margin:0 0 6px 0;}",
-        ".warn{background:#fff3cd;border:1px solid #ffe69c;}",
-        "</style></head><body>",
-        f"<h1>📊 Decision Dashboard — {ticker}</h1>",
-        f"<p><b>Generated:</b> {utc_now()}</p>",
-    ]
+    buf = io.StringIO()
+    w = buf.write
+    w(
+        "<!doctype html>\n"
+        "<html><head><meta charset='utf-8'/>\n"
+        f"<title>Decision Dashboard — {ticker}</title>\n"
+        "<style>\n"
+        "body{font-family:system-ui,-apple-system,Segoe UI,Roboto,Arial;max-width:980px;margin:24px auto;padding:0 12px;}\n"
+        "code{background:#f3f3f3;padding:2px 6px;border-radius:6px;}\n"
+        ".card{border:1px solid #ddd;border-radius:16px;padding:14px 16px;margin:12px 0;}\n"
+        "h1{margin:0 0 6px 0;}\n"
+        ".warn{background:#fff3cd;border:1px solid #ffe69c;}\n"
+        "</style></head><body>\n"
+        f"<h1>📊 Decision Dashboard — {ticker}</h1>\n"
+        f"<p><b>Generated:</b> {utc_now()}</p>\n"
+    )
 
     if mismatch:
-        html += [
-            "<div class='card warn'>",
-            "<h2>⚠️ Ticker mismatch warning</h2>",
-            f"<p>Your <code>outputs/decision_summary.json</code> says ticker <b>{summary_ticker}</b>, but you asked for <b>{ticker}</b>.</p>",
-            "<p>This usually means the engine update step didn’t run for the requested ticker (or wrote over the shared summary).</p>",
-            "</div>",
-        ]
-
-    html += ["<div class='card'>", "<h2>1) Quick summary</h2>"]
+        w(
+            "<div class='card warn'>\n"
+            "<h2>⚠️ Ticker mismatch warning</h2>\n"
+            f"<p>Your <code>outputs/decision_summary.json</code> says ticker <b>{summary_ticker}</b>, but you asked for <b>{ticker}</b>.</p>\n"
+            "<p>This usually means the engine update step didn’t run for the requested ticker (or wrote over the shared summary).</p>\n"
+            "</div>\n"
+        )
+
+    w("<div class='card'>\n<h2>1) Quick summary</h2>\n")
     if rating is not None and score is not None:
-        html += [f"<p><b>Model rating:</b> {rating} &nbsp; <b>Score:</b> {score}/100</p>"]
+        w(f"<p><b>Model rating:</b> {rating} &nbsp; <b>Score:</b> {score}/100</p>\n")
     else:
-        html += ["<p><b>Model rating:</b> N/A (missing decision_summary.json)</p>"]
+        w("<p><b>Model rating:</b> N/A (missing decision_summary.json)</p>\n")
 
     if bucket:
-        html += ["<p><b>Bucket scores:</b></p><ul>"]
-        for k, v in bucket.items():
-            html += [f"<li>{k}: <b>{v}</b></li>"]
-        html += ["</ul>"]
+        w("<p><b>Bucket scores:</b></p><ul>\n")
+        w("".join(f"<li>{k}: <b>{v}</b></li>\n" for k, v in bucket.items()))
+        w("</ul>\n")
 
     if red_flags:
-        html += ["<p><b>Red flags:</b></p><ul>"]
-        for rf in red_flags:
-            html += [f"<li>{rf}</li>"]
-        html += ["</ul>"]
+        w("<p><b>Red flags:</b></p><ul>\n")
+        w("".join(f"<li>{rf}</li>\n" for rf in red_flags))
+        w("</ul>\n")
     else:
-        html += ["<p><b>Red flags:</b> none listed</p>"]
-
-    html += ["</div>"]
-
-    html += ["<div class='card'>", "<h2>2) What to open (in order)</h2>",
-             "<ol>",
-             f"<li><b>Full memo PDF</b> — <code>export/{ticker}_Full_Investment_Memo.pdf</code></li>",
-             f"<li><b>Claim evidence</b> — <code>outputs/claim_evidence_{ticker}.html</code></li>",
-             f"<li><b>Clickpack</b> — <code>outputs/news_clickpack_{ticker}.html</code></li>",
-             "</ol>",
-             "</div>"]
-
-    html += ["<div class='card'>", "<h2>3) All artifacts</h2>", "<ul>"]
-    html += [_link(label, rel) for (label, rel) in artifacts]
-    html += ["</ul></div>"]
-
-    html += ["<div class='card'>", "<h2>3) Plain-English cheat sheet</h2>",
-             "<ul>",
-             "<li><b>Score</b>: 0–100 summary signal from cash/growth/valuation/quality/risk buckets.</li>",
-             "<li><b>Clickpack</b>: raw headlines with URLs so you can verify the model isn’t hallucinating.</li>",
-             "<li><b>Claim evidence</b>: maps each thesis claim to supporting/contradicting headlines.</li>",
-             "<li><b>Veracity</b>: checks if evidence is diverse and from higher-trust domains.</li>",
-             "</ul>",
-             "</div>"]
-
-    html += ["</body></html>"]
+        w("<p><b>Red flags:</b> none listed</p>\n")
+
+    w("</div>\n")
+
+    w(
+        "<div class='card'>\n<h2>2) What to open (in order)</h2>\n"
+        "<ol>\n"
+        f"<li><b>Full memo PDF</b> — <code>export/{ticker}_Full_Investment_Memo.pdf</code></li>\n"
+        f"<li><b>Claim evidence</b> — <code>outputs/claim_evidence_{ticker}.html</code></li>\n"
+        f"<li><b>Clickpack</b> — <code>outputs/news_clickpack_{ticker}.html</code></li>\n"
+        "</ol>\n"
+        "</div>\n"
+    )
+
+    w("<div class='card'>\n<h2>3) All artifacts</h2>\n<ul>\n")
+    listing = _list_dirs(rel for (_, rel) in artifacts)
+    w("".join(_link(label, rel, listing) + "\n" for (label, rel) in artifacts))
+    w("</ul></div>\n")
+
+    w(
+        "<div class='card'>\n<h2>3) Plain-English cheat sheet</h2>\n"
+        "<ul>\n"
+        "<li><b>Score</b>: 0–100 summary signal from cash/growth/valuation/quality/risk buckets.</li>\n"
+        "<li><b>Clickpack</b>: raw headlines with URLs so you can verify the model isn’t hallucinating.</li>\n"
+        "<li><b>Claim evidence</b>: maps each thesis claim to supporting/contradicting headlines.</li>\n"
+        "<li><b>Veracity</b>: checks if evidence is diverse and from higher-trust domains.</li>\n"
+        "</ul>\n"
+        "</div>\n"
+    )
+
+    w("</body></html>\n")
 
     out = OUTPUTS / f"decision_dashboard_{ticker}.html"
-    out.write_text("\n".join(html), encoding="utf-8")
+    out.write_text(buf.getvalue(), encoding="utf-8")
     return out
 
 
@@ -11,13 +11,30 @@ if str(_REPO_ROOT) not in sys.path:
 
 import argparse
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timezone, timedelta
 
+import numpy as np
 import pandas as pd
 
+try:
+    import orjson
+except ImportError:  # optional: stdlib json fallback
+    orjson = None
+
+
+def json_loads(data):
+    # json.dumps writes NaN/Infinity literals, which orjson rejects: reparse with stdlib json
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
 from analytics.news.source_weights import weight_for_source
-from analytics.news.confirmation import confirmed_risk_tags
+from analytics.news.confirmation import confirmed_risk_tags_cols
 
 ROOT = Path(__file__).resolve().parents[1]
 PROCESSED = ROOT / "data" / "processed"
@@ -29,7 +46,7 @@ def _utc_now_iso() -> str:
 def _load_config():
     cfg_path = ROOT / "config" / "run_config.json"
     if cfg_path.exists():
-        return json.loads(cfg_path.read_text(encoding="utf-8"))
+        return json_loads(cfg_path.read_bytes())
     return {}
 
 def _read_news_unified() -> pd.DataFrame:
@@ -39,7 +56,12 @@ def _read_news_unified() -> pd.DataFrame:
     df = pd.read_csv(p)
     return df
 
-def _tactical_signal(df: pd.DataFrame, ticker: str) -> dict:
+def _for_ticker(df: pd.DataFrame, ticker: str) -> pd.DataFrame:
+    if df.empty:
+        return df
+    return df[df["ticker"].astype(str).str.upper() == ticker.upper()]
+
+def _tactical_signal(dfx: pd.DataFrame, ticker: str) -> dict:
     """
     Fast layer: detect abnormal short-term negativity. Lightweight & cheap.
     Uses the existing proxy file if present; otherwise uses simple headline counts.
@@ -62,16 +84,13 @@ def _tactical_signal(df: pd.DataFrame, ticker: str) -> dict:
             return tactical
 
     # fallback: naive last-7d counts
-    if df.empty or "published_at" not in df.columns:
-        return tactical
-
-    dfx = df[df["ticker"].astype(str).str.upper() == ticker.upper()].copy()
-    if dfx.empty:
+    if dfx.empty or "published_at" not in dfx.columns:
         return tactical
 
-    dfx["published_at"] = pd.to_datetime(dfx["published_at"], errors="coerce", utc=True)
+    # dfx is shared with the other helpers: derive, don't mutate
+    published = pd.to_datetime(dfx["published_at"], errors="coerce", utc=True)
     since = datetime.now(timezone.utc) - timedelta(days=7)
-    d7 = dfx[dfx["published_at"] >= since]
+    d7 = dfx[published >= since]
     tactical["articles_7d"] = int(len(d7))
     tactical["neg_7d"] = int((d7.get("impact_score", 0).fillna(0) < 0).sum()) if "impact_score" in d7.columns else None
     # Tactical alert if lots of negatives (fallback rule)
@@ -79,36 +98,39 @@ def _tactical_signal(df: pd.DataFrame, ticker: str) -> dict:
         tactical["tactical_alert"] = True
     return tactical
 
-def _institutional_confirm(df: pd.DataFrame, ticker: str, min_confirmations: int, cred_th: float) -> dict:
-    if df.empty:
-        return {"confirmed_tags": {}, "confirmed_any": False}
+def _norm_col(df: pd.DataFrame, col: str) -> pd.Series:
+    if col not in df.columns:
+        return pd.Series("", index=df.index, dtype=object)
+    return df[col].fillna("").astype(str).str.strip()
 
-    dfx = df[df["ticker"].astype(str).str.upper() == ticker.upper()].copy()
+def _institutional_confirm(dfx: pd.DataFrame, min_confirmations: int, cred_th: float) -> dict:
     if dfx.empty:
         return {"confirmed_tags": {}, "confirmed_any": False}
 
-    # convert to list of dicts for the confirmation function
-    rows = dfx.to_dict(orient="records")
-    conf = confirmed_risk_tags(rows, min_confirmations=min_confirmations, credibility_threshold=cred_th)
+    # column views instead of one dict per row
+    cols = {
+        "risk_tag": _norm_col(dfx, "risk_tag").str.upper().to_numpy(),
+        "source": _norm_col(dfx, "source").str.lower().to_numpy(),
+    }
+    conf = confirmed_risk_tags_cols(cols, min_confirmations=min_confirmations, credibility_threshold=cred_th)
     return {"confirmed_tags": conf, "confirmed_any": bool(conf)}
 
-def _source_mix(df: pd.DataFrame, ticker: str) -> dict:
-    if df.empty:
-        return {"top_source": None, "source_share_top": None, "source_diversity": 0, "cred_weighted_avg": None}
-
-    dfx = df[df["ticker"].astype(str).str.upper() == ticker.upper()].copy()
+def _source_mix(dfx: pd.DataFrame) -> dict:
     if dfx.empty or "source" not in dfx.columns:
         return {"top_source": None, "source_share_top": None, "source_diversity": 0, "cred_weighted_avg": None}
 
-    counts = dfx["source"].fillna("unknown").astype(str).str.lower().value_counts()
+    lowered = dfx["source"].fillna("unknown").astype(str).str.lower()
+    # top source from value_counts itself: its tie order is what reports have always shown
+    counts = lowered.value_counts()
     top_source = counts.index[0] if len(counts) else None
     total = int(counts.sum()) if len(counts) else 0
     top_share = float(counts.iloc[0] / total) if total else None
     diversity = int(len(counts))
 
-    # credibility weighted average
-    w = dfx["source"].fillna("unknown").astype(str).str.lower().map(weight_for_source)
-    cred_avg = float(w.mean()) if len(w) else None
+    # credibility weighted average (one weight lookup per unique source)
+    uniq, inv = np.unique(lowered.to_numpy(), return_inverse=True)
+    w = np.array([weight_for_source(u) for u in uniq], dtype=float)
+    cred_avg = float(w[inv].mean()) if total else None
 
     return {"top_source": top_source, "source_share_top": top_share, "source_diversity": diversity, "cred_weighted_avg": cred_avg}
 
@@ -118,11 +140,14 @@ def main(ticker: str, mode: str):
     min_conf = int(trust.get("min_confirmations", 2))
     cred_th = float(trust.get("credibility_threshold", 1.5))
 
-    df = _read_news_unified()
+    dfx = _for_ticker(_read_news_unified(), ticker)
 
-    tactical = _tactical_signal(df, ticker)
-    inst = _institutional_confirm(df, ticker, min_conf, cred_th)
-    mix = _source_mix(df, ticker)
+    # independent scans of the same (read-only) frame; pandas/NumPy kernels release the GIL
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        f_tactical = ex.submit(_tactical_signal, dfx, ticker)
+        f_inst = ex.submit(_institutional_confirm, dfx, min_conf, cred_th)
+        f_mix = ex.submit(_source_mix, dfx)
+        tactical, inst, mix = f_tactical.result(), f_inst.result(), f_mix.result()
 
     hybrid = {
         "as_of": _utc_now_iso(),
@@ -135,7 +160,10 @@ def main(ticker: str, mode: str):
     }
 
     out = OUTPUTS / f"hybrid_signals_{ticker.upper()}.json"
-    out.write_text(json.dumps(hybrid, indent=2), encoding="utf-8")
+    if orjson is not None:
+        out.write_bytes(orjson.dumps(hybrid, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        out.write_text(json.dumps(hybrid, indent=2), encoding="utf-8")
     print(f"DONE ✅ hybrid signals: {out}")
 
 if __name__ == "__main__":
@@ -1,16 +1,40 @@
 #!/usr/bin/env python3
+import io
 import json
 import argparse
+from dataclasses import dataclass
+from typing import Optional
 from pathlib import Path
-from datetime import datetime
-from docx import Document
+from datetime import datetime, timezone
+from xml.sax.saxutils import escape as xml_escape
+
+try:
+    import orjson
+except ImportError:  # optional: stdlib json fallback
+    orjson = None
+
+def json_loads(data):
+    # both parsers accept raw bytes, so callers skip the separate UTF-8 decode;
+    # json.dumps writes NaN/Infinity literals, which orjson rejects: reparse with stdlib json
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
 
 ROOT = Path(__file__).resolve().parents[1]
 OUTPUTS = ROOT / "outputs"
 EXPORT = ROOT / "export"
 
 def utc_now():
-    return datetime.utcnow().strftime("%Y-%m-%d %H:%M UTC")
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
+
+def safe_read_json(path):
+    try:
+        return json_loads(path.read_bytes())
+    except Exception:
+        return {}
 
 
 
@@ -45,66 +69,148 @@ def build_deadline_explainers(summary, metrics):
     lines.append("")
     return lines
 
-def main(ticker, thesis_path=None):
+MD_PREFIX = {"title": "# ", "h1": "## ", "h2": "### ", "small": "*", "p": "", "li": "- ", "blank": ""}
+MD_SUFFIX = {"small": "*"}
+
+def _runs_xml(text, rpr=""):
+    # **bold** spans become bold runs instead of literal asterisks
+    out = []
+    for i, part in enumerate(text.split("**")):
+        if part:
+            props = rpr + ("<w:b/>" if i % 2 else "")
+            props = f"<w:rPr>{props}</w:rPr>" if props else ""
+            out.append(f'<w:r>{props}<w:t xml:space="preserve">{xml_escape(part)}</w:t></w:r>')
+    return "".join(out)
+
+def _p_xml(text, style=None, rpr=""):
+    ppr = f'<w:pPr><w:pStyle w:val="{style}"/></w:pPr>' if style else ""
+    return f"<w:p>{ppr}{_runs_xml(text, rpr)}</w:p>"
+
+# kind -> <w:p> builder; style ids come from python-docx's default template
+DOCX_RENDER = {
+    "title": lambda t: _p_xml(t, "Title"),
+    "h1": lambda t: _p_xml(t, "Heading1"),
+    "h2": lambda t: _p_xml(t, "Heading2"),
+    "small": lambda t: _p_xml(t, rpr='<w:i/><w:sz w:val="18"/>'),
+    "p": lambda t: _p_xml(t),
+    "li": lambda t: _p_xml(t, "ListBullet"),
+    "blank": lambda t: "",
+}
+
+def doc_add_xml(doc, xml):
+    # Parse every paragraph in one go and splice them in ahead of sectPr,
+    # instead of one add_paragraph/add_run round-trip per line.
+    from docx.oxml import parse_xml
+    from docx.oxml.ns import nsdecls
+
+    paras = list(parse_xml(f"<w:body {nsdecls('w')}>{xml}</w:body>"))
+    body = doc.element.body
+    sect = body.sectPr
+    at = body.index(sect) if sect is not None else len(body)
+    body[at:at] = paras
+
+@dataclass
+class MemoContext:
+    """Inputs shared by every memo in one process, loaded once for batch runs."""
+    summary: dict
+    template: Optional[bytes]  # None -> Markdown only, python-docx never imported
+
+    @classmethod
+    def load(cls, with_docx=True):
+        template = None
+        if with_docx:
+            from docx import Document
+
+            buf = io.BytesIO()
+            Document().save(buf)
+            template = buf.getvalue()
+        return cls(summary=safe_read_json(OUTPUTS / "decision_summary.json"), template=template)
+
+def run(ticker, ctx, thesis_path=None):
     ticker = ticker.upper()
 
-    summary = json.load(open(OUTPUTS / "decision_summary.json"))
-    alerts = json.load(open(OUTPUTS / f"alerts_{ticker}.json")) if (OUTPUTS / f"alerts_{ticker}.json").exists() else {}
+    summary = ctx.summary
+    alerts = safe_read_json(OUTPUTS / f"alerts_{ticker}.json")
 
     rating = summary.get("rating")
     score = summary.get("score")
 
-    md = []
-    md.append(f"# Full Investment Memo — {ticker}")
-    md.append(f"*Generated: {utc_now()}*")
-    md.append("")
-    md.append("## Quick summary")
-    md.append(f"- Model rating: **{rating}** ({score}/100)")
-    md.append("")
+    # One structured list feeds both the Markdown and the DOCX renderer.
+    sections = []
+    add = sections.append
+    add(("title", f"Full Investment Memo — {ticker}"))
+    add(("small", f"Generated: {utc_now()}"))
+    add(("blank", ""))
+    add(("h1", "Quick summary"))
+    add(("li", f"Model rating: **{rating}** ({score}/100)"))
+    add(("blank", ""))
 
     if alerts:
-        md.append("## Red flags")
-        for r in alerts.get("red_flags", []):
-            md.append(f"- {r}")
-        md.append("")
-
-    md.append("## What to open")
-    md.append(f"- PDF: export/{ticker}_Full_Investment_Memo.pdf")
-    md.append(f"- Dashboard: outputs/decision_dashboard_{ticker}.html")
-    md.append(f"- News: outputs/news_clickpack_{ticker}.html")
-    md.append("")
-
-    md.append("## Plain English")
-    md.append("This report combines financials, valuation, growth, balance sheet, and recent news.")
-    md.append("Higher scores mean stronger business quality and lower risk.")
-    md.append("")
-
-    md.append("## Verdict")
+        add(("h1", "Red flags"))
+        sections.extend(("li", str(r)) for r in alerts.get("red_flags", []))
+        add(("blank", ""))
+
+    add(("h1", "What to open"))
+    add(("li", f"PDF: export/{ticker}_Full_Investment_Memo.pdf"))
+    add(("li", f"Dashboard: outputs/decision_dashboard_{ticker}.html"))
+    add(("li", f"News: outputs/news_clickpack_{ticker}.html"))
+    add(("blank", ""))
+
+    add(("h1", "Plain English"))
+    add(("p", "This report combines financials, valuation, growth, balance sheet, and recent news."))
+    add(("p", "Higher scores mean stronger business quality and lower risk."))
+    add(("blank", ""))
+
+    add(("h1", "Verdict"))
     if rating == "BUY":
-        md.append("Business fundamentals currently outweigh risks.")
+        add(("p", "Business fundamentals currently outweigh risks."))
     elif rating == "HOLD":
-        md.append("Mixed signals. Wait for clearer direction.")
+        add(("p", "Mixed signals. Wait for clearer direction."))
     else:
-        md.append("Risks dominate fundamentals right now.")
+        add(("p", "Risks dominate fundamentals right now."))
 
     md_path = OUTPUTS / f"{ticker}_Full_Investment_Memo.md"
-    md_path.write_text("\n".join(md), encoding="utf-8")
-
-    doc = Document()
-    for line in md:
-        doc.add_paragraph(line)
+    # Stream the Markdown to disk and collect the DOCX XML in the same pass.
+    with_docx = ctx.template is not None
+    xml = []
+    with open(md_path, "w", encoding="utf-8") as fh:
+        w = fh.write
+        sep = ""
+        for kind, text in sections:
+            w(sep + MD_PREFIX[kind] + text + MD_SUFFIX.get(kind, ""))
+            sep = "\n"
+            if with_docx:
+                xml.append(DOCX_RENDER[kind](text))
+
+    if not with_docx:
+        return md_path, None
+
+    from docx import Document
+
+    doc = Document(io.BytesIO(ctx.template))
+    doc_add_xml(doc, "".join(xml))
 
     EXPORT.mkdir(exist_ok=True)
     docx_path = EXPORT / f"{ticker}_Full_Investment_Memo.docx"
     doc.save(docx_path)
+    return md_path, docx_path
 
+def main(ticker, thesis_path=None, no_docx=False):
+    md_path, docx_path = run(ticker, MemoContext.load(with_docx=not no_docx), thesis_path)
     print(f"DONE Memo created:")
     print("-", md_path)
-    print("-", docx_path)
+    if docx_path is not None:
+        print("-", docx_path)
+
+def main_many(tickers, no_docx=False):
+    """Library entry point: one context (summary + DOCX template) for N memos."""
+    ctx = MemoContext.load(with_docx=not no_docx)
+    return [run(t, ctx) for t in tickers]
 
 if __name__ == "__main__":
     ap = argparse.ArgumentParser()
     ap.add_argument("--ticker", required=True)
     ap.add_argument("--thesis")
+    ap.add_argument("--no-docx", action="store_true", help="only write the Markdown memo")
     args = ap.parse_args()
-    main(args.ticker, args.thesis)
+    main(args.ticker, args.thesis, args.no_docx)
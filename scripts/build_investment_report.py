@@ -1,26 +1,42 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import argparse
+import importlib.util
+import io
 import os
+import re
 import sys
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-from urllib.parse import urlparse
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from urllib.parse import unquote, urlparse
+from xml.sax.saxutils import escape as xml_escape
 
+import numpy as np
 import pandas as pd
 
-from docx import Document
-from docx.shared import Pt
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.oxml import OxmlElement
-from docx.oxml.ns import qn
+try:
+    import orjson
+except ImportError:  # optional: stdlib json fallback
+    orjson = None
 
-from openpyxl import Workbook
-from openpyxl.styles import Font, Alignment
-from openpyxl.utils.dataframe import dataframe_to_rows
-from openpyxl.worksheet.table import Table, TableStyleInfo
+
+def json_loads(data):
+    # json.dumps writes NaN/Infinity literals, which orjson rejects: reparse with stdlib json
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+if TYPE_CHECKING:  # python-docx stays a lazy import at runtime
+    from docx.document import Document
 
 
 # --- bootstrap: allow imports reliably if we add them later ---
@@ -35,6 +51,10 @@ EXPORT = ROOT / "export"
 
 TICKER = os.getenv("TICKER", "UBER").upper()
 
+# FAST_IO=1: serve CSV inputs from a fresh .parquet/.feather sibling when one exists
+# (siblings are written explicitly with --write-fast-siblings, never as a read side effect)
+FAST_IO = os.getenv("FAST_IO", "0") == "1"
+
 
 def _utc_now() -> str:
     return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
@@ -44,20 +64,99 @@ def _safe_read_json(path: Path) -> dict:
     if not path.exists():
         return {}
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return json_loads(path.read_bytes())
     except Exception:
         return {}
 
 
-def _safe_read_csv(path: Path) -> pd.DataFrame:
+def _read_fast_sibling(path: Path) -> Optional[pd.DataFrame]:
+    csv_mtime = path.stat().st_mtime_ns
+    for suffix, reader in ((".parquet", pd.read_parquet), (".feather", pd.read_feather)):
+        p = path.with_suffix(suffix)
+        try:
+            # a sibling older than the CSV is stale -> ignore it
+            if p.exists() and p.stat().st_mtime_ns >= csv_mtime:
+                return reader(p)
+        except Exception:
+            pass
+    return None
+
+
+# Arrow-backed strings when pyarrow is installed: faster .str/isin/map, ~half the memory
+_TEXT_DTYPE = "string[pyarrow]" if importlib.util.find_spec("pyarrow") is not None else str
+_NEWS_TEXT_COLS = ("ticker", "source", "url", "title", "risk_tag")
+_NEWS_DTYPES = {c: _TEXT_DTYPE for c in _NEWS_TEXT_COLS}
+
+
+def _with_text_dtype(df: pd.DataFrame, cols=_NEWS_TEXT_COLS) -> pd.DataFrame:
+    # convert once at load; missing values become "" rather than the string "nan"
+    conv = {c: df[c].fillna("").astype(_TEXT_DTYPE) for c in cols if c in df.columns}
+    return df.assign(**conv) if conv else df
+
+
+def _as_text(s: pd.Series) -> pd.Series:
+    return s if isinstance(s.dtype, pd.StringDtype) else s.astype(str)
+
+
+def _ticker_mask(col: pd.Series, ticker: str) -> np.ndarray:
+    # upper-case the handful of distinct tickers, not every row; NaN (code -1) never matches
+    codes, uniq = pd.factorize(col)
+    hit = pd.Index(uniq).astype(str).str.upper() == ticker.upper()
+    return np.append(hit, False)[codes]
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    # one write to a sibling temp file, then rename: readers never see a half-written report
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+# Report text is dumped with stdlib json only: orjson (optional, not in requirements.txt)
+# writes NaN as null and formats exponents differently (1e-7 vs 1e-07), so using it here
+# would make report content depend on what happens to be installed.
+def _dumps_indent(obj) -> str:
+    return json.dumps(obj, indent=2)
+
+
+def _dumps_compact(obj) -> str:
+    # single-line JSON for spreadsheet cells
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def _safe_read_csv(path: Path, **read_kw) -> pd.DataFrame:
     if not path.exists():
         return pd.DataFrame()
+    # a sibling can honour dtype= and a usecols list; anything else needs the CSV parser
+    if FAST_IO and set(read_kw) <= {"dtype", "usecols"} and not callable(read_kw.get("usecols")):
+        df = _read_fast_sibling(path)
+        if df is not None:
+            if read_kw.get("usecols") is not None:
+                df = df[[c for c in df.columns if c in set(read_kw["usecols"])]]
+            dtype = read_kw.get("dtype")
+            if isinstance(dtype, dict):
+                df = df.astype({c: t for c, t in dtype.items() if c in df.columns})
+            elif dtype is not None:
+                df = df.astype(dtype)
+            return df
     try:
-        return pd.read_csv(path)
+        return pd.read_csv(path, **read_kw)
     except Exception:
         return pd.DataFrame()
 
 
+def write_fast_siblings(paths) -> List[Path]:
+    """Write a .parquet sibling next to each CSV (full file, as parsed) for FAST_IO=1 runs."""
+    written = []
+    for path in paths:
+        if not path.exists():
+            continue
+        out = path.with_suffix(".parquet")
+        pd.read_csv(path).to_parquet(out, index=False)
+        written.append(out)
+    return written
+
+
 def extract_domain(url: str) -> str:
     if not url or str(url).strip() in ("None", ""):
         return ""
@@ -73,227 +172,400 @@ def extract_domain(url: str) -> str:
         return ""
 
 
+_DOMAIN_RE = re.compile(r"^https?://(?:www\.)?([^/?#]*)")
+# google.com/url?q=<target>&... wrappers: show the target, not the redirect
+_REDIRECT_RE = re.compile(r"^https?://(?:www\.)?google\.[a-z.]+/url\?(?:[^#]*&)?q=([^&#]+)")
+_URL_DISPLAY_MAX = 500
+
+
+def _fmt_utc_minutes(ts: pd.Series) -> pd.Series:
+    # "%Y-%m-%d %H:%M UTC" for a UTC datetime column via NumPy's datetime64[m] -> str,
+    # instead of pandas' per-value strftime; NaT stays missing like strftime's NaN
+    iso = np.datetime_as_string(ts.dt.tz_convert(None).to_numpy(dtype="datetime64[m]"))
+    out = pd.Series(iso, index=ts.index, dtype=object).str.replace("T", " ", regex=False) + " UTC"
+    return out.where(ts.notna())
+
+
+def _vec_extract_domain(urls: pd.Series) -> pd.Series:
+    # column version of extract_domain: one regex pass instead of urlparse per row
+    return _as_text(urls).str.strip().str.lower().str.extract(_DOMAIN_RE, expand=False).fillna("")
+
+
 # ---------------------------
 # Pretty Word helpers
 # ---------------------------
-def _shade_cell(cell, fill_hex: str = "F2F2F2"):
-    tc = cell._tc
-    tcPr = tc.get_or_add_tcPr()
-    shd = OxmlElement("w:shd")
-    shd.set(qn("w:val"), "clear")
-    shd.set(qn("w:color"), "auto")
-    shd.set(qn("w:fill"), fill_hex)
-    tcPr.append(shd)
-
-
-def _format_table(table, header_fill="E8EEF7", header_font_size=10, body_font_size=9):
-    hdr = table.rows[0].cells
-    for c in hdr:
-        _shade_cell(c, header_fill)
-        for p in c.paragraphs:
-            p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            for r in p.runs:
-                r.bold = True
-                r.font.size = Pt(header_font_size)
-
-    for row in table.rows[1:]:
-        for c in row.cells:
-            for p in c.paragraphs:
-                p.paragraph_format.space_after = Pt(2)
-                for r in p.runs:
-                    r.font.size = Pt(body_font_size)
-
-
-def _bullet(doc: Document, text: str, level: int = 0):
-    style = "List Bullet" if level == 0 else "List Bullet 2"
-    doc.add_paragraph(text, style=style)
+def build_fast_table(doc: Document, df: pd.DataFrame, header_fill="E8EEF7", header_font_size=10, body_font_size=9,
+                     max_rows=500):
+    # Whole <w:tbl> as one XML string, parsed once: header shading, centering and
+    # run sizes are templated instead of set cell by cell through python-docx.
+    # Past max_rows the body is split into back-to-back tables (header repeated):
+    # Word lays out per table, and one huge table is slow to open.
+    from docx.shared import Emu
+    from docx.oxml import parse_xml
+    from docx.oxml.ns import nsdecls
+
+    sec = doc.sections[-1]
+    col_w = int(Emu(sec.page_width - sec.left_margin - sec.right_margin).twips / len(df.columns))
+    tc_pr = f'<w:tcPr><w:tcW w:type="dxa" w:w="{col_w}"/></w:tcPr>'
+    hdr_tc_pr = f'<w:tcPr><w:tcW w:type="dxa" w:w="{col_w}"/><w:shd w:val="clear" w:color="auto" w:fill="{header_fill}"/></w:tcPr>'
+    hdr_p_pr = '<w:pPr><w:jc w:val="center"/></w:pPr>'
+    body_p_pr = '<w:pPr><w:spacing w:after="40"/></w:pPr>'
+    hdr_r_pr = f'<w:rPr><w:b/><w:sz w:val="{header_font_size * 2}"/></w:rPr>'
+    body_r_pr = f'<w:rPr><w:sz w:val="{body_font_size * 2}"/></w:rPr>'
+
+    def tr(values, tcp, ppr, rpr):
+        return "<w:tr>" + "".join(
+            f'<w:tc>{tcp}<w:p>{ppr}<w:r>{rpr}<w:t xml:space="preserve">{xml_escape(str(v))}</w:t></w:r></w:p></w:tc>'
+            for v in values
+        ) + "</w:tr>"
+
+    head = (
+        f"<w:tbl {nsdecls('w')}>"
+        '<w:tblPr><w:tblW w:type="auto" w:w="0"/>'
+        '<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" w:lastRow="0" w:noHBand="0" w:noVBand="1" w:val="04A0"/>'
+        "</w:tblPr>"
+        "<w:tblGrid>" + f'<w:gridCol w:w="{col_w}"/>' * len(df.columns) + "</w:tblGrid>"
+        + tr(df.columns, hdr_tc_pr, hdr_p_pr, hdr_r_pr)
+    )
+    body = doc.element.body
+    for start in range(0, max(len(df), 1), max_rows):
+        if start:
+            body.add_p()  # adjacent tables would merge into one without a paragraph between
+        rows = df.iloc[start:start + max_rows].itertuples(index=False, name=None)
+        body._insert_tbl(parse_xml(head + "".join(tr(row, tc_pr, body_p_pr, body_r_pr) for row in rows) + "</w:tbl>"))
+
+
+def _append_paras(doc: Document, items):
+    # (text, style name) pairs -> one parse + one splice ahead of sectPr, instead of
+    # an add_paragraph/add_heading (and style lookup) per line. None = Normal.
+    from docx.oxml import parse_xml
+    from docx.oxml.ns import nsdecls
+
+    style_ids = {}
+    parts = []
+    for text, style in items:
+        if style is None:
+            ppr = ""
+        else:
+            if style not in style_ids:
+                style_ids[style] = doc.styles[style].style_id
+            ppr = f'<w:pPr><w:pStyle w:val="{style_ids[style]}"/></w:pPr>'
+        parts.append(f'<w:p>{ppr}<w:r><w:t xml:space="preserve">{xml_escape(text)}</w:t></w:r></w:p>')
+    if not parts:
+        return
+    body = doc.element.body
+    sect = body.sectPr
+    at = body.index(sect) if sect is not None else len(body)
+    body[at:at] = list(parse_xml(f"<w:body {nsdecls('w')}>{''.join(parts)}</w:body>"))
+
+
+BULLET = "List Bullet"
+BULLET_2 = "List Bullet 2"
+
+
+def _display_urls(urls: pd.Series) -> pd.Series:
+    """Unwrap Google /url?q= redirects (URL-decoding the target) and cap the length.
+
+    >>> _display_urls(pd.Series([
+    ...     "https://www.google.com/url?sa=t&q=https%3A%2F%2Fexample.com%2Fa%3Fb%3D1&usg=x",
+    ...     " https://example.org/news ",
+    ... ])).tolist()
+    ['https://example.com/a?b=1', 'https://example.org/news']
+    """
+    # one vectorized pass, not per bullet; only the redirect hits are decoded
+    u = urls.astype(str).str.strip()
+    target = u.str.extract(_REDIRECT_RE, expand=False)
+    hit = target.notna()
+    target.loc[hit] = target.loc[hit].map(unquote)
+    return target.fillna(u).str.slice(0, _URL_DISPLAY_MAX)
+
+
+def _evidence_bullets(df: pd.DataFrame):
+    # Stringify each column once and zip, instead of five row.get() lookups per
+    # iterrows() Series; missing columns render as row.get() did ("None", url "").
+    def col(name):
+        return df[name].astype(str).tolist() if name in df.columns else ["None"] * len(df)
+
+    if "url" in df.columns:
+        urls = _display_urls(df["url"]).tolist()
+    else:
+        urls = [""] * len(df)
+
+    items = []
+    for pub, tag, impact, title, url in zip(
+        col("published_at"), col("risk_tag"), col("impact_score"), col("title"), urls
+    ):
+        items.append((f"{pub} [{tag}] ({impact}): {title}", BULLET))
+        items.append((url, BULLET_2))
+    return items
+
+
+def _red_flag_paras(red_flags: list):
+    if not red_flags:
+        return [("No structured red flags were found this run.", None)]
+    items = []
+    for rf in red_flags[:12]:
+        items += [
+            (f"[{rf.get('severity')}] {rf.get('title')}", "Heading 2"),
+            (f"Plain English: {rf.get('plain_english')}", None),
+            (f"Why it matters: {rf.get('why_it_matters')}", None),
+            (f"What to check: {rf.get('what_to_check')}", None),
+        ]
+    return items
+
+
+def _scenario_paras(scenario: dict):
+    if not scenario or not scenario.get("results"):
+        return [("Scenario model not available.", None)]
+    results = scenario["results"]
+    items = []
+    for name in ("bear", "base", "bull"):
+        r = results.get(name, {})
+        items += [
+            (f"{name.upper()} scenario", "Heading 2"),
+            (f"Projected FCF: {r.get('projected_fcf')}", None),
+            (f"Target FCF Yield: {r.get('target_fcf_yield')}", None),
+            (f"Implied Market Cap: {r.get('implied_market_cap')}", None),
+            (f"Implied Upside (%): {r.get('implied_upside_pct')}", None),
+        ]
+    return items
 
 
 # ---------------------------
 # Interpretation keys
 # ---------------------------
+_METRIC_CHEAT_ROWS = (
+    {"Metric": "Revenue Growth (YoY %)", "Meaning": "Is the company getting bigger?", "Good": "> 10%", "OK": "0–10%", "Bad": "< 0%", "Why it matters": "Growth supports future cash and valuation."},
+    {"Metric": "Free Cash Flow (FCF)", "Meaning": "Cash left after running the business + capex.", "Good": "Positive and rising", "OK": "Positive but flat", "Bad": "Negative", "Why it matters": "FCF funds buybacks, debt paydown, and growth."},
+    {"Metric": "FCF Margin (%)", "Meaning": "How much cash is produced per $1 of sales.", "Good": "> 10%", "OK": "0–10%", "Bad": "< 0%", "Why it matters": "Higher = better business economics."},
+    {"Metric": "FCF Yield", "Meaning": "Cash return vs price you pay (FCF / Market Cap).", "Good": "> 5%", "OK": "2–5%", "Bad": "< 2%", "Why it matters": "Higher yield often means cheaper vs cash."},
+    {"Metric": "Net Debt / FCF", "Meaning": "Years of FCF needed to pay net debt.", "Good": "< 3x", "OK": "3–6x", "Bad": "> 6x", "Why it matters": "Lower = safer in downturns."},
+    {"Metric": "News Shock (7d/30d)", "Meaning": "Severity of negative headlines (more negative = worse).", "Good": "Near 0", "OK": "-1 to -10", "Bad": "< -10", "Why it matters": "Large shocks often reflect real events."},
+    {"Metric": "Confidence (Veracity)", "Meaning": "How easy it is to verify sources quickly.", "Good": "> 70", "OK": "40–70", "Bad": "< 40", "Why it matters": "Low confidence = more manual verification needed."},
+)
+
+
+@lru_cache(maxsize=1)
 def metric_cheat_sheet() -> pd.DataFrame:
-    rows = [
-        {"Metric": "Revenue Growth (YoY %)", "Meaning": "Is the company getting bigger?", "Good": "> 10%", "OK": "0–10%", "Bad": "< 0%", "Why it matters": "Growth supports future cash and valuation."},
-        {"Metric": "Free Cash Flow (FCF)", "Meaning": "Cash left after running the business + capex.", "Good": "Positive and rising", "OK": "Positive but flat", "Bad": "Negative", "Why it matters": "FCF funds buybacks, debt paydown, and growth."},
-        {"Metric": "FCF Margin (%)", "Meaning": "How much cash is produced per $1 of sales.", "Good": "> 10%", "OK": "0–10%", "Bad": "< 0%", "Why it matters": "Higher = better business economics."},
-        {"Metric": "FCF Yield", "Meaning": "Cash return vs price you pay (FCF / Market Cap).", "Good": "> 5%", "OK": "2–5%", "Bad": "< 2%", "Why it matters": "Higher yield often means cheaper vs cash."},
-        {"Metric": "Net Debt / FCF", "Meaning": "Years of FCF needed to pay net debt.", "Good": "< 3x", "OK": "3–6x", "Bad": "> 6x", "Why it matters": "Lower = safer in downturns."},
-        {"Metric": "News Shock (7d/30d)", "Meaning": "Severity of negative headlines (more negative = worse).", "Good": "Near 0", "OK": "-1 to -10", "Bad": "< -10", "Why it matters": "Large shocks often reflect real events."},
-        {"Metric": "Confidence (Veracity)", "Meaning": "How easy it is to verify sources quickly.", "Good": "> 70", "OK": "40–70", "Bad": "< 40", "Why it matters": "Low confidence = more manual verification needed."},
-    ]
-    return pd.DataFrame(rows)
+    # built once per process and shared by the Word/Excel writers: treat as read-only
+    return pd.DataFrame(list(_METRIC_CHEAT_ROWS))
 
 
-def curated_evidence_pack(news_df: pd.DataFrame, ticker: str, top_n: int = 12) -> pd.DataFrame:
-    if news_df.empty:
-        return pd.DataFrame(columns=["published_at", "risk_tag", "impact_score", "source", "domain", "title", "url"])
+def _top_n_desc(score: np.ndarray, n: int) -> np.ndarray:
+    # positions of the n highest scores, best first; ties keep row order.
+    # A stable sort of a few thousand floats is cheap, and unlike argpartition it
+    # decides deterministically which rows tied at the cutoff make the cut.
+    return np.argsort(-score, kind="stable")[:n]
 
-    df = news_df.copy()
-    df["ticker"] = df.get("ticker", "").astype(str).str.upper()
-    df = df[df["ticker"] == ticker.upper()].copy()
 
-    df["published_at_dt"] = pd.to_datetime(df.get("published_at", None), errors="coerce", utc=True)
-    df["impact_score"] = pd.to_numeric(df.get("impact_score", 0), errors="coerce").fillna(0)
-    df["risk_tag"] = df.get("risk_tag", "OTHER").astype(str).str.upper()
-    df["source"] = df.get("source", "unknown").astype(str)
-    df["title"] = df.get("title", "").astype(str)
-    df["url"] = df.get("url", "").astype(str)
-    df["domain"] = df["url"].apply(extract_domain)
+def _dense_recency(ts: pd.Series) -> np.ndarray:
+    # rank(ascending=False, method="dense").fillna(999) on the raw int64 ticks: one
+    # np.unique instead of pandas' rank machinery; newest = 1, NaT = 999
+    valid = ts.notna().to_numpy()
+    ticks = ts.dt.tz_convert(None).to_numpy().view("int64")[valid]
+    uniq, inv = np.unique(ticks, return_inverse=True)
+    recency = np.full(len(ts), 999.0)
+    recency[valid] = len(uniq) - inv
+    return recency
 
-    # prioritize negative / risk-tagged / recent
-    tag_weight = {"REGULATORY": 3, "INSURANCE": 3, "LABOR": 2, "SAFETY": 2, "OTHER": 1}
-    df["_tag_w"] = df["risk_tag"].map(tag_weight).fillna(1)
-    df["_recency"] = df["published_at_dt"].rank(ascending=False, method="dense").fillna(999)
-    df["_priority"] = (-df["impact_score"]) * 4 + df["_tag_w"] * 3 + (1000 - df["_recency"])
 
-    df = df.sort_values("_priority", ascending=False).head(top_n)
-    df["published_at"] = df["published_at_dt"].dt.strftime("%Y-%m-%d %H:%M UTC")
+_TAG_CATS = ["REGULATORY", "INSURANCE", "LABOR", "SAFETY", "OTHER"]
+_TAG_WEIGHTS = np.array([3, 3, 2, 2, 1], dtype=float)
+
+_PREP_COLS = ["ticker", "published_at", "impact_score", "risk_tag", "source", "title", "url"]
+_EVIDENCE_COLS = ["published_at", "risk_tag", "impact_score", "source", "domain", "title", "url"]
 
-    return df[["published_at", "risk_tag", "impact_score", "source", "domain", "title", "url"]].copy()
 
+def _prepare_news(news_df: pd.DataFrame, ticker: str) -> Optional[pd.DataFrame]:
+    """One ticker's news with the casts, parsed timestamp and domain both selectors read.
 
-def worst_negative_news(news_df: pd.DataFrame, ticker: str, n: int = 10) -> pd.DataFrame:
-    if news_df is None or news_df.empty:
-        return pd.DataFrame(columns=["published_at", "risk_tag", "impact_score", "source", "domain", "title", "url"])
-    df = news_df.copy()
-    df["ticker"] = df.get("ticker", "").astype(str).str.upper()
-    df = df[df["ticker"] == ticker.upper()].copy()
+    Returns None when there is nothing to select from.
+    """
+    if news_df is None or news_df.empty or "ticker" not in news_df.columns:
+        return None
+    # filter first, then project onto the columns we read: reindex builds the one new
+    # frame (absent columns come back as NaN), so no full copy of news_df is made
+    df = news_df.loc[_ticker_mask(news_df["ticker"], ticker)].reindex(columns=_PREP_COLS)
     if df.empty:
-        return pd.DataFrame(columns=["published_at", "risk_tag", "impact_score", "source", "domain", "title", "url"])
+        return None
+
+    url = _as_text(df["url"].fillna(""))
+    df = df.assign(
+        ticker=ticker.upper(),
+        published_at_dt=pd.to_datetime(df["published_at"], errors="coerce", utc=True),
+        impact_score=pd.to_numeric(df["impact_score"], errors="coerce").fillna(0),
+        risk_tag=_as_text(df["risk_tag"].fillna("OTHER")).str.upper(),
+        source=_as_text(df["source"].fillna("unknown")),
+        title=_as_text(df["title"].fillna("")),
+        url=url,
+        domain=_vec_extract_domain(url),
+    )
+    return df
+
+
+def curated_evidence_pack(prepared: Optional[pd.DataFrame], top_n: int = 12) -> pd.DataFrame:
+    if prepared is None or prepared.empty:
+        return pd.DataFrame(columns=_EVIDENCE_COLS)
+    df = prepared
 
-    df["impact_score"] = pd.to_numeric(df.get("impact_score", 0), errors="coerce").fillna(0)
-    df["published_at_dt"] = pd.to_datetime(df.get("published_at", None), errors="coerce", utc=True)
-    df["source"] = df.get("source", "unknown").astype(str)
-    df["title"] = df.get("title", "").astype(str)
-    df["url"] = df.get("url", "").astype(str)
-    df["risk_tag"] = df.get("risk_tag", "OTHER").astype(str).str.upper()
-    df["domain"] = df["url"].apply(extract_domain)
-    df["published_at"] = df["published_at_dt"].dt.strftime("%Y-%m-%d %H:%M UTC")
+    # prioritize negative / risk-tagged / recent
+    impact = df["impact_score"].to_numpy(dtype=float)
+    # tag -> weight by category code + np.take; tags outside the table weigh 1
+    codes = pd.Categorical(df["risk_tag"], categories=_TAG_CATS).codes
+    tag_w = np.where(codes >= 0, _TAG_WEIGHTS[codes], 1.0)
+    recency = _dense_recency(df["published_at_dt"])
+    priority = -impact * 4 + tag_w * 3 + (1000 - recency)
 
-    # lower impact_score = worse (more negative)
-    df = df.sort_values(["impact_score", "published_at_dt"], ascending=[True, False]).head(n)
-    return df[["published_at", "risk_tag", "impact_score", "source", "domain", "title", "url"]].copy()
+    df = df.iloc[_top_n_desc(priority, top_n)].copy()
+    df["published_at"] = _fmt_utc_minutes(df["published_at_dt"])
+    return df[_EVIDENCE_COLS]
 
 
-# ---------------------------
-# Excel helpers
-# ---------------------------
-def _autosize_columns(ws):
-    for col in ws.columns:
-        max_len = 10
-        col_letter = col[0].column_letter
-        for cell in col:
-            try:
-                v = "" if cell.value is None else str(cell.value)
-                max_len = max(max_len, len(v))
-            except Exception:
-                pass
-        ws.column_dimensions[col_letter].width = min(60, max_len + 2)
-
-
-def _style_table(ws, name: str):
-    try:
-        tab = Table(displayName="T" + "".join([c for c in name if c.isalnum()])[:24], ref=ws.dimensions)
-        style = TableStyleInfo(name="TableStyleMedium9", showRowStripes=True, showColumnStripes=False)
-        tab.tableStyleInfo = style
-        ws.add_table(tab)
-    except Exception:
-        pass
+def worst_negative_news(prepared: Optional[pd.DataFrame], n: int = 10) -> pd.DataFrame:
+    if prepared is None or prepared.empty:
+        return pd.DataFrame(columns=_EVIDENCE_COLS)
 
+    # lower impact_score = worse (more negative). Heap-select the n-th worst score, then
+    # fully sort only the rows at or below it (ties included, original order kept).
+    impact = prepared["impact_score"]
+    cutoff = impact.nsmallest(n).max()
+    cand = prepared[impact <= cutoff] if len(prepared) > n else prepared
+    df = cand.sort_values(["impact_score", "published_at_dt"], ascending=[True, False]).iloc[:n]
+    # format only the rows we keep, from the already-parsed column
+    df["published_at"] = _fmt_utc_minutes(df["published_at_dt"])
+    return df[_EVIDENCE_COLS]
 
-def _add_df_sheet(wb: Workbook, name: str, df: pd.DataFrame):
-    ws = wb.create_sheet(title=name)
-    if df is None or df.empty:
-        ws["A1"] = "No data"
-        return ws
-    for r in dataframe_to_rows(df, index=False, header=True):
-        ws.append(r)
-    for cell in ws[1]:
-        cell.font = Font(bold=True)
-        cell.alignment = Alignment(wrap_text=True, vertical="top")
-    ws.freeze_panes = "A2"
-    _style_table(ws, name)
-    _autosize_columns(ws)
+
+# ---------------------------
+# Excel helpers (xlsxwriter engine)
+# ---------------------------
+def _autosize_columns(ws, df: pd.DataFrame, col_formats: Optional[Dict[int, Any]] = None):
+    # xlsxwriter can't read cells back, so size from the frame we just wrote,
+    # one vectorized str.len() per column (null cells never beat the floor of 10)
+    col_formats = col_formats or {}
+    for i, c in enumerate(df.columns):
+        longest = int(df[c].astype(str).str.len().max()) if len(df) else 0
+        max_len = max(10, len(str(c)), longest)
+        ws.set_column(i, i, min(60, max_len + 2), col_formats.get(i))
+
+
+def _style_table(ws, name: str, df: pd.DataFrame, header_fmt):
+    ws.add_table(0, 0, len(df), len(df.columns) - 1, {
+        "name": "T" + "".join([c for c in name if c.isalnum()])[:24],
+        "style": "TableStyleMedium9",
+        "banded_rows": True,
+        "columns": [{"header": str(c), "header_format": header_fmt} for c in df.columns],
+    })
+
+
+def _add_df_sheet(writer: pd.ExcelWriter, name: str, df: pd.DataFrame, num_formats: Optional[Dict[str, str]] = None):
+    # callers skip empty frames (see write_excel_report's "Missing" sheet)
+    # header row is written by add_table; data starts on row 2
+    df.to_excel(writer, sheet_name=name, index=False, header=False, startrow=1)
+    ws = writer.sheets[name]
+    header_fmt = writer.book.add_format({"bold": True, "text_wrap": True, "valign": "top"})
+    _style_table(ws, name, df, header_fmt)
+    ws.freeze_panes(1, 0)
+    cols = list(df.columns)
+    col_formats = {
+        cols.index(c): writer.book.add_format({"num_format": f})
+        for c, f in (num_formats or {}).items() if c in cols
+    }
+    _autosize_columns(ws, df, col_formats)
     return ws
 
 
-def write_excel_report(path: Path, summary: dict, card: dict, curated: pd.DataFrame):
+def write_excel_report(path: Path, summary: dict, card: dict, curated: pd.DataFrame, ticker: str = TICKER,
+                       generated: Optional[str] = None):
     path.parent.mkdir(parents=True, exist_ok=True)
-    wb = Workbook()
-    wb.remove(wb.active)
-
-    ws = wb.create_sheet("Decision_Card")
-    ws.append(["key", "value"])
-    for cell in ws[1]:
-        cell.font = Font(bold=True)
+    generated = generated or _utc_now()
 
     rows = [
-        ("ticker", TICKER),
-        ("generated", _utc_now()),
+        ("ticker", ticker),
+        ("generated", generated),
         ("score", summary.get("score")),
         ("rating", summary.get("rating")),
         ("data_completeness_score", summary.get("data_completeness_score")),
         ("confidence_score", summary.get("confidence_score")),
         ("confidence_explainer", "Higher = easier to verify sources quickly. Low = concentrated sources / fewer top-tier links."),
-        ("bucket_scores", json.dumps(summary.get("bucket_scores", {}))),
-        ("lights", json.dumps(card.get("lights", {}))),
-        ("red_flags", json.dumps(summary.get("red_flags", []))),
+        ("bucket_scores", _dumps_compact(summary.get("bucket_scores", {}))),
+        ("lights", _dumps_compact(card.get("lights", {}))),
+        ("red_flags", _dumps_compact(summary.get("red_flags", []))),
     ]
-    for k, v in rows:
-        ws.append([k, v])
-    ws.freeze_panes = "A2"
-    _autosize_columns(ws)
-
-    _add_df_sheet(wb, "Curated_Evidence", curated)
-    _add_df_sheet(wb, "Metric_Cheat_Sheet", metric_cheat_sheet())
+    df_card = pd.DataFrame(rows, columns=["key", "value"])
 
     # Key inputs (human readable)
     ki = summary.get("key_inputs_used", {}) or {}
-    df_ki = pd.DataFrame([{"Metric": k, "Raw": v} for k, v in ki.items()])
-
-    def to_num(x):
-        try:
-            return float(x)
-        except Exception:
-            return None
-
-    def dollars_to_b(x):
-        n = to_num(x)
-        if n is None:
-            return None
-        return n / 1e9
+    df_ki = pd.DataFrame({"Metric": list(ki.keys()), "Raw": list(ki.values())})
 
     if not df_ki.empty:
-        df_ki["Value ($B)"] = df_ki["Raw"].apply(dollars_to_b)
-
-    ws2 = _add_df_sheet(wb, "Key_Inputs_Human", df_ki)
-    # format $B column
-    if "Value ($B)" in df_ki.columns:
-        col_idx = list(df_ki.columns).index("Value ($B)") + 1
-        for r in range(2, ws2.max_row + 1):
-            ws2.cell(row=r, column=col_idx).number_format = "0.00"
-
-    wb.save(path)
-
-
-def _df_to_html(df: pd.DataFrame, max_rows=50, link_title_col="title", url_col="url") -> str:
+        df_ki["Value ($B)"] = pd.to_numeric(df_ki["Raw"], errors="coerce") / 1e9
+
+    buf = io.BytesIO()
+    with pd.ExcelWriter(buf, engine="xlsxwriter") as writer:
+        bold = writer.book.add_format({"bold": True})
+        df_card.to_excel(writer, sheet_name="Decision_Card", index=False, header=False, startrow=1)
+        ws = writer.sheets["Decision_Card"]
+        ws.write_row(0, 0, list(df_card.columns), bold)
+        ws.freeze_panes(1, 0)
+        _autosize_columns(ws, df_card)
+
+        sheets = [
+            ("Curated_Evidence", curated, {}),
+            ("Metric_Cheat_Sheet", metric_cheat_sheet(), {}),
+            # format $B column
+            ("Key_Inputs_Human", df_ki, {"num_formats": {"Value ($B)": "0.00"}}),
+        ]
+        # empty sources get one line on a shared "Missing" sheet instead of a sheet each
+        missing = []
+        for name, df, kwargs in sheets:
+            if df is None or df.empty:
+                missing.append(name)
+                continue
+            _add_df_sheet(writer, name, df, **kwargs)
+        if missing:
+            ws = writer.book.add_worksheet("Missing")
+            ws.write(0, 0, "Empty sources (no sheet written)", bold)
+            ws.write_column(1, 0, missing)
+            ws.set_column(0, 0, 34)
+    _write_atomic(path, buf.getvalue())
+
+
+def _vec_escape(s: pd.Series) -> pd.Series:
+    return (
+        s.astype("string")
+        .str.replace("&", "&amp;", regex=False)
+        .str.replace("<", "&lt;", regex=False)
+        .str.replace(">", "&gt;", regex=False)
+        .fillna("")
+    )
+
+
+def _df_to_html(df: pd.DataFrame, max_rows=50, link_title_col="title", url_col="url", buf=None) -> Optional[str]:
+    # buf: write straight into an open file instead of returning the markup
     if df is None or df.empty:
-        return "<p><em>No data.</em></p>"
-    d = df.head(max_rows).copy()
+        if buf is None:
+            return "<p><em>No data.</em></p>"
+        buf.write("<p><em>No data.</em></p>")
+        return None
+    d = df.iloc[:max_rows].copy()
+    # escape=False keeps our anchors intact, so escape the text columns ourselves, column-wise
+    for c in d.columns:
+        if d[c].dtype == object or isinstance(d[c].dtype, pd.StringDtype):
+            d[c] = _vec_escape(d[c])
     if link_title_col in d.columns and url_col in d.columns:
-        def linkify(row):
-            u = str(row.get(url_col, ""))
-            t = str(row.get(link_title_col, ""))
-            if u.startswith("http"):
-                return f'<a href="{u}" target="_blank" rel="noopener noreferrer">{t}</a>'
-            return t
-        d[link_title_col] = d.apply(linkify, axis=1)
-    return d.to_html(index=False, escape=False)
+        u = d[url_col]
+        t = d[link_title_col]
+        href = u.str.replace('"', "&quot;", regex=False)
+        linked = '<a href="' + href + '" target="_blank" rel="noopener noreferrer">' + t + "</a>"
+        d[link_title_col] = linked.where(u.str.startswith("http"), t)
+    return d.to_html(buf=buf, index=False, escape=False)
 
 
-def write_html_report(path: Path, summary: dict, card: dict, curated: pd.DataFrame, worst: pd.DataFrame, news_df: pd.DataFrame):
+def write_html_report(path: Path, summary: dict, card: dict, curated: pd.DataFrame, worst: pd.DataFrame, news_df: pd.DataFrame,
+                      ticker: str = TICKER, generated: Optional[str] = None):
     path.parent.mkdir(parents=True, exist_ok=True)
+    generated = generated or _utc_now()
 
     score = summary.get("score")
     rating = summary.get("rating")
@@ -321,10 +593,10 @@ def write_html_report(path: Path, summary: dict, card: dict, curated: pd.DataFra
         confidence_help = "This is veracity/ease-of-verification. Low usually means evidence is concentrated in 1 source or few top-tier publisher links."
 
     def bucket_rows():
-        rows = ""
-        for k, v in buckets.items():
-            rows += f"<tr><td>{k}</td><td>{v}</td><td>{lights.get(k,'')}</td></tr>"
-        return rows
+        return "\n".join(
+            f"<tr><td>{k}</td><td>{v}</td><td>{lights.get(k,'')}</td></tr>"
+            for k, v in buckets.items()
+        )
 
     def red_flag_cards():
         if not red_flags_structured:
@@ -347,9 +619,14 @@ def write_html_report(path: Path, summary: dict, card: dict, curated: pd.DataFra
 
     conf_reason_html = "<ul>" + "".join([f"<li>{r}</li>" for r in conf_reasons[:8]]) + "</ul>" if conf_reasons else "<p><em>No reasons.</em></p>"
 
-    html = f"""
+    # Stream sections (and to_html tables) straight into the file; the page is
+    # never held in memory as one string. A 1 MiB buffer and no newline translation
+    # keep it to a few large writes.
+    with path.open("w", encoding="utf-8", newline="", buffering=1 << 20) as fh:
+        w = fh.write
+        w(f"""
     <html><head><meta charset="utf-8"/>
-    <title>Decision Report — {TICKER}</title>
+    <title>Decision Report — {ticker}</title>
     <style>
       body {{ font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Arial, sans-serif; padding: 24px; background:#fbfbfb; }}
       .muted {{ color:#666; }}
@@ -367,8 +644,8 @@ def write_html_report(path: Path, summary: dict, card: dict, curated: pd.DataFra
       .section {{ margin-top: 18px; }}
     </style>
     </head><body>
-      <h1>Decision Report — {TICKER}</h1>
-      <div class="muted">Generated: {_utc_now()}</div>
+      <h1>Decision Report — {ticker}</h1>
+      <div class="muted">Generated: {generated}</div>
 
       <div class="grid section">
         <div class="card">
@@ -383,45 +660,62 @@ def write_html_report(path: Path, summary: dict, card: dict, curated: pd.DataFra
           <h3 style="margin-top:0;">Buckets</h3>
           <table>
             <tr><th>Bucket</th><th>Points</th><th>Light</th></tr>
-            {bucket_rows()}
+            """)
+        w(bucket_rows())
+        w("""
           </table>
         </div>
       </div>
 
       <div class="card section">
         <h2 style="margin-top:0;">Red Flags (Risks You Must Read)</h2>
-        {red_flag_cards()}
+        """)
+        w(red_flag_cards())
+        w(f"""
         <p class="mini muted">Tip: these are generated from cash-flow volatility, leverage, repeated risk-tag themes, and news shock.</p>
       </div>
 
       <div class="card section">
         <h2 style="margin-top:0;">Worst Negative Headlines (Top {min(10, len(worst))})</h2>
-        {_df_to_html(worst, 50)}
+        """)
+        _df_to_html(worst, 50, buf=fh)
+        w("""
         <p class="mini muted">These are the most negative-impact items. Click to verify.</p>
       </div>
 
       <div class="card section">
         <h2 style="margin-top:0;">Curated Evidence Pack (Start here)</h2>
-        {_df_to_html(curated, 50)}
+        """)
+        _df_to_html(curated, 50, buf=fh)
+        w(f"""
       </div>
 
       <div class="card section">
         <h2 style="margin-top:0;">Confidence Breakdown (Why it is {confidence_label})</h2>
-        {conf_reason_html}
-        <pre class="mini muted" style="white-space: pre-wrap;">{json.dumps(conf_meta, indent=2)[:2500]}</pre>
+        """)
+        w(conf_reason_html)
+        w("""
+        <pre class="mini muted" style="white-space: pre-wrap;">""")
+        w(_dumps_indent(conf_meta)[:2500])
+        w("""</pre>
       </div>
 
       <div class="card section">
         <h2 style="margin-top:0;">All News (first 200)</h2>
-        {_df_to_html(news_df, 200)}
+        """)
+        _df_to_html(news_df, 200, buf=fh)
+        w("""
       </div>
 
     </body></html>
-    """
-    path.write_text(html, encoding="utf-8")
+    """)
+
 
+def write_word_report(path: Path, summary: dict, card: dict, curated: pd.DataFrame, worst: pd.DataFrame,
+                      ticker: str = TICKER, generated: Optional[str] = None):
+    # python-docx is only loaded when a Word report is actually written
+    from docx import Document
 
-def write_word_report(path: Path, summary: dict, card: dict, curated: pd.DataFrame, worst: pd.DataFrame):
     path.parent.mkdir(parents=True, exist_ok=True)
     doc = Document()
 
@@ -436,127 +730,119 @@ def write_word_report(path: Path, summary: dict, card: dict, curated: pd.DataFra
     conf_reasons = summary.get("confidence_reasons", []) or []
     scenario = summary.get("scenario_summary", {}) or {}
 
-    doc.add_heading(f"Investment Decision Report — {TICKER}", level=0)
-    doc.add_paragraph(f"Generated: {_utc_now()}")
-
-    doc.add_heading("Decision Card (read this first)", level=1)
-    doc.add_paragraph(f"Score: {score}/100   |   Rating: {rating}")
-    doc.add_paragraph(f"Data completeness: {completeness}/100")
-    doc.add_paragraph(f"Confidence (veracity): {confidence if confidence is not None else 'N/A'}/100")
-
-    doc.add_paragraph("Bucket traffic lights:", style="List Bullet")
-    for k, v in buckets.items():
-        doc.add_paragraph(f"{k}: {v} points → {lights.get(k, 'GRAY')}", style="List Bullet 2")
-
-    doc.add_heading("Next Steps (exactly what to do)", level=1)
-    doc.add_paragraph("Use the time budget that fits your life. The goal is quick verification, not perfection.")
-    _bullet(doc, "3 minutes:", 0)
-    _bullet(doc, "1) Read Decision Card + Red Flags.", 1)
-    _bullet(doc, "2) Click Worst Negative Headlines (top 3).", 1)
-    _bullet(doc, "3) If the negatives are real + repeating → downgrade thesis confidence.", 1)
-
-    _bullet(doc, "10 minutes:", 0)
-    _bullet(doc, "4) Read Curated Evidence Pack (10–12 items).", 1)
-    _bullet(doc, "5) Use Metric Cheat Sheet to label numbers good/ok/bad.", 1)
-
-    _bullet(doc, "30 minutes:", 0)
-    _bullet(doc, "6) Compare UBER vs LYFT vs DASH in Excel.", 1)
-    _bullet(doc, "7) Check scenario ranges (bear/base/bull).", 1)
-
-    doc.add_heading("How the engine arrives at the score", level=1)
-    _bullet(doc, "1) Collect inputs: fundamentals + market + peers + news.", 0)
-    _bullet(doc, "2) Convert to metrics (TTM cash, growth, margins, yield, leverage).", 0)
-    _bullet(doc, "3) Score five buckets and add them.", 0)
-    _bullet(doc, "4) Generate red flags + scenarios + confidence.", 0)
-
-    doc.add_heading("Metric Cheat Sheet (good vs bad)", level=1)
-    mcs = metric_cheat_sheet()
-    t = doc.add_table(rows=1, cols=len(mcs.columns))
-    for i, c in enumerate(mcs.columns):
-        t.rows[0].cells[i].text = str(c)
-    for _, row in mcs.iterrows():
-        cells = t.add_row().cells
-        for i, c in enumerate(mcs.columns):
-            cells[i].text = str(row.get(c, ""))
-    _format_table(t)
-
-    doc.add_heading("Red Flags (Risks you must read)", level=1)
-    if not red_flags_structured:
-        doc.add_paragraph("No structured red flags were found this run.")
-    else:
-        for rf in red_flags_structured[:12]:
-            doc.add_paragraph(f"[{rf.get('severity')}] {rf.get('title')}", style="Heading 2")
-            doc.add_paragraph(f"Plain English: {rf.get('plain_english')}")
-            doc.add_paragraph(f"Why it matters: {rf.get('why_it_matters')}")
-            doc.add_paragraph(f"What to check: {rf.get('what_to_check')}")
+    # Every section is collected as (text, style) pairs and spliced into the body
+    # in two batches, either side of the cheat-sheet table.
+    head = [
+        (f"Investment Decision Report — {ticker}", "Title"),
+        (f"Generated: {generated or _utc_now()}", None),
+        ("Decision Card (read this first)", "Heading 1"),
+        (f"Score: {score}/100   |   Rating: {rating}", None),
+        (f"Data completeness: {completeness}/100", None),
+        (f"Confidence (veracity): {confidence if confidence is not None else 'N/A'}/100", None),
+        ("Bucket traffic lights:", BULLET),
+    ]
+    head += [(f"{k}: {v} points → {lights.get(k, 'GRAY')}", BULLET_2) for k, v in buckets.items()]
+    head += [
+        ("Next Steps (exactly what to do)", "Heading 1"),
+        ("Use the time budget that fits your life. The goal is quick verification, not perfection.", None),
+        ("3 minutes:", BULLET),
+        ("1) Read Decision Card + Red Flags.", BULLET_2),
+        ("2) Click Worst Negative Headlines (top 3).", BULLET_2),
+        ("3) If the negatives are real + repeating → downgrade thesis confidence.", BULLET_2),
+        ("10 minutes:", BULLET),
+        ("4) Read Curated Evidence Pack (10–12 items).", BULLET_2),
+        ("5) Use Metric Cheat Sheet to label numbers good/ok/bad.", BULLET_2),
+        ("30 minutes:", BULLET),
+        ("6) Compare UBER vs LYFT vs DASH in Excel.", BULLET_2),
+        ("7) Check scenario ranges (bear/base/bull).", BULLET_2),
+        ("How the engine arrives at the score", "Heading 1"),
+        ("1) Collect inputs: fundamentals + market + peers + news.", BULLET),
+        ("2) Convert to metrics (TTM cash, growth, margins, yield, leverage).", BULLET),
+        ("3) Score five buckets and add them.", BULLET),
+        ("4) Generate red flags + scenarios + confidence.", BULLET),
+        ("Metric Cheat Sheet (good vs bad)", "Heading 1"),
+    ]
+    _append_paras(doc, head)
+    build_fast_table(doc, metric_cheat_sheet())
+
+    tail = [("Red Flags (Risks you must read)", "Heading 1")]
+    tail += _red_flag_paras(red_flags_structured)
 
-    doc.add_heading("Worst Negative Headlines (verify these first)", level=1)
+    tail.append(("Worst Negative Headlines (verify these first)", "Heading 1"))
     if worst is None or worst.empty:
-        doc.add_paragraph("No worst-negative list available.")
+        tail.append(("No worst-negative list available.", None))
     else:
-        for _, row in worst.iterrows():
-            _bullet(doc, f"{row.get('published_at')} [{row.get('risk_tag')}] ({row.get('impact_score')}): {row.get('title')}", 0)
-            _bullet(doc, str(row.get("url", "")), 1)
+        tail += _evidence_bullets(worst)
 
-    doc.add_heading("Confidence (veracity)", level=1)
-    doc.add_paragraph("This is NOT a price prediction. It measures how easy it is to verify evidence by clicking.")
-    doc.add_paragraph(f"Confidence score: {confidence if confidence is not None else 'N/A'}/100")
+    tail += [
+        ("Confidence (veracity)", "Heading 1"),
+        ("This is NOT a price prediction. It measures how easy it is to verify evidence by clicking.", None),
+        (f"Confidence score: {confidence if confidence is not None else 'N/A'}/100", None),
+    ]
     if conf_reasons:
-        doc.add_paragraph("Reasons:", style="List Bullet")
-        for r in conf_reasons[:10]:
-            doc.add_paragraph(str(r), style="List Bullet 2")
+        tail.append(("Reasons:", BULLET))
+        tail += [(str(r), BULLET_2) for r in conf_reasons[:10]]
 
-    doc.add_heading("Data completeness (did anything fail?)", level=1)
+    tail.append(("Data completeness (did anything fail?)", "Heading 1"))
     if missing:
-        doc.add_paragraph("Missing / empty inputs:", style="List Bullet")
-        for m in missing:
-            doc.add_paragraph(str(m), style="List Bullet 2")
+        tail.append(("Missing / empty inputs:", BULLET))
+        tail += [(str(m), BULLET_2) for m in missing]
     else:
-        doc.add_paragraph("No missing/empty core inputs detected.")
+        tail.append(("No missing/empty core inputs detected.", None))
 
-    doc.add_heading("Scenario context (Bear / Base / Bull)", level=1)
-    if not scenario or not scenario.get("results"):
-        doc.add_paragraph("Scenario model not available.")
-    else:
-        results = scenario["results"]
-        for name in ("bear", "base", "bull"):
-            r = results.get(name, {})
-            doc.add_paragraph(f"{name.upper()} scenario", style="Heading 2")
-            doc.add_paragraph(f"Projected FCF: {r.get('projected_fcf')}")
-            doc.add_paragraph(f"Target FCF Yield: {r.get('target_fcf_yield')}")
-            doc.add_paragraph(f"Implied Market Cap: {r.get('implied_market_cap')}")
-            doc.add_paragraph(f"Implied Upside (%): {r.get('implied_upside_pct')}")
-
-    doc.add_heading("Curated Evidence Pack (start here)", level=1)
+    tail.append(("Scenario context (Bear / Base / Bull)", "Heading 1"))
+    tail += _scenario_paras(scenario)
+
+    tail.append(("Curated Evidence Pack (start here)", "Heading 1"))
     if curated is None or curated.empty:
-        doc.add_paragraph("No curated evidence available.")
+        tail.append(("No curated evidence available.", None))
     else:
-        for _, row in curated.iterrows():
-            _bullet(doc, f"{row.get('published_at')} [{row.get('risk_tag')}] ({row.get('impact_score')}): {row.get('title')}", 0)
-            _bullet(doc, str(row.get("url", "")), 1)
-
-    doc.save(path)
-
-
-def main():
+        tail += _evidence_bullets(curated)
+    _append_paras(doc, tail)
+
+    buf = io.BytesIO()
+    doc.save(buf)
+    _write_atomic(path, buf.getvalue())
+
+
+def _write_reports(ticker: str, summary: dict, news: pd.DataFrame, generated: str):
+    card = _safe_read_json(OUTPUTS / f"decision_card_{ticker}.json")
+    # filter + cast the ticker's news once; both selectors rank the same frame
+    prepared = _prepare_news(news, ticker)
+    curated = curated_evidence_pack(prepared, top_n=12)
+    worst = worst_negative_news(prepared, n=10)
+
+    html_path = OUTPUTS / f"decision_report_{ticker}.html"
+    docx_path = EXPORT / f"{ticker}_Investment_Report.docx"
+    xlsx_path = EXPORT / f"{ticker}_Investment_Report.xlsx"
+
+    # independent writers over the same read-only inputs, one output file each
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        futures = [
+            ex.submit(write_html_report, html_path, summary, card, curated, worst, news, ticker, generated),
+            ex.submit(write_word_report, docx_path, summary, card, curated, worst, ticker, generated),
+            ex.submit(write_excel_report, xlsx_path, summary, card, curated, ticker, generated),
+        ]
+        for f in futures:
+            f.result()
+    return html_path, docx_path, xlsx_path
+
+
+def main_batch(tickers: List[str]):
+    """Library entry point: parse the shared inputs once, then write every ticker's reports."""
     OUTPUTS.mkdir(parents=True, exist_ok=True)
     EXPORT.mkdir(parents=True, exist_ok=True)
 
     summary = _safe_read_json(OUTPUTS / "decision_summary.json")
-    card = _safe_read_json(OUTPUTS / f"decision_card_{TICKER}.json")
-    news = _safe_read_csv(DATA_PROCESSED / "news_unified.csv")
+    # text columns parse straight into their final dtype; _with_text_dtype only fills the gaps
+    news = _with_text_dtype(_safe_read_csv(DATA_PROCESSED / "news_unified.csv", dtype=_NEWS_DTYPES))
+    # one timestamp per run: every report in the batch carries the same "Generated" stamp
+    generated = _utc_now()
+    return [_write_reports(t.upper(), summary, news, generated) for t in tickers]
 
-    curated = curated_evidence_pack(news, TICKER, top_n=12)
-    worst = worst_negative_news(news, TICKER, n=10)
 
-    html_path = OUTPUTS / f"decision_report_{TICKER}.html"
-    write_html_report(html_path, summary, card, curated, worst, news)
-
-    docx_path = EXPORT / f"{TICKER}_Investment_Report.docx"
-    write_word_report(docx_path, summary, card, curated, worst)
-
-    xlsx_path = EXPORT / f"{TICKER}_Investment_Report.xlsx"
-    write_excel_report(xlsx_path, summary, card, curated)
+def main():
+    [(html_path, docx_path, xlsx_path)] = main_batch([TICKER])
 
     print("DONE ✅ Upgraded reports created:")
     print(f"- {html_path}")
@@ -565,4 +851,12 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--write-fast-siblings", action="store_true",
+                    help="write .parquet siblings of the processed CSV inputs for FAST_IO=1 runs, then exit")
+    args = ap.parse_args()
+    if args.write_fast_siblings:
+        for p in write_fast_siblings([DATA_PROCESSED / "news_unified.csv"]):
+            print(f"DONE ✅ {p}")
+    else:
+        main()
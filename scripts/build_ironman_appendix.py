@@ -95,7 +95,7 @@ The engine also writes `veracity_{t}.json`. This is the machine-readable view of
 """
 
     out = OUTPUTS / f"ironman_appendix_{t}.md"
-    out.write_text(md, encoding="utf-8")
+    out.write_bytes(md.encode("utf-8"))
     print(f"DONE ✅ appendix: {out}")
 
 if __name__ == "__main__":
@@ -1,5 +1,6 @@
 from pathlib import Path
 import json
+import operator
 from typing import Dict, Any
 import pandas as pd
 from datetime import datetime
@@ -30,8 +31,13 @@ def _first_row_as_dict(df, col, val):
         return {}
     return r.iloc[0].to_dict()
 
-def _risk_metric_key(tag, window):
-    return f"risk_{tag.lower()}_neg_{window}"
+def _latest_row(df, col):
+    # O(n) scan for the newest row instead of sorting the whole frame every run;
+    # ties resolve to the later row, as a stable sort + iloc[-1] would.
+    if col not in df.columns:
+        return df.iloc[-1]
+    keys = df[col].fillna("").astype(str).to_numpy()
+    return df.iloc[len(keys) - 1 - int(keys[::-1].argmax())]
 
 # ---------------- metric lookup ----------------
 
@@ -41,8 +47,7 @@ def _build_metric_lookup(summary, proxy_df, comps_df, risk_df, ticker):
 
     fundamentals = _safe_read_csv(DATA_PROCESSED / "fundamentals_annual_history.csv")
     if fundamentals is not None and not fundamentals.empty:
-        fundamentals = fundamentals.sort_values("period_end")
-        last = fundamentals.iloc[-1]
+        last = _latest_row(fundamentals, "period_end")
 
         out["latest_revenue_yoy_pct"] = last.get("revenue_yoy_pct")
         out["latest_free_cash_flow"] = last.get("free_cash_flow")
@@ -57,14 +62,24 @@ def _build_metric_lookup(summary, proxy_df, comps_df, risk_df, ticker):
         out["fcf_yield_pct"] = float(fy) * 100
 
     risk = risk_df[risk_df["ticker"] == ticker] if risk_df is not None else pd.DataFrame()
-    for _, r in risk.iterrows():
-        tag = r["risk_tag"]
-        out[_risk_metric_key(tag, "30d")] = r["neg_count_30d"]
+    if not risk.empty:
+        # one vectorized lower() for every tag instead of one per row
+        keys = ("risk_" + risk["risk_tag"].astype(str).str.lower() + "_neg_30d").to_numpy()
+        out.update(zip(keys, risk["neg_count_30d"].to_numpy()))
 
     return out
 
 # ---------------- thesis eval ----------------
 
+_OPS = {
+    ">=": operator.ge,
+    ">": operator.gt,
+    "<=": operator.le,
+    "<": operator.lt,
+    "==": operator.eq,
+    "=": operator.eq,
+}
+
 def eval_claim(val, op, thresh):
     try:
         v = float(val)
@@ -72,11 +87,8 @@ def eval_claim(val, op, thresh):
     except Exception:
         return None
 
-    if op == ">=": return v >= t
-    if op == ">": return v > t
-    if op == "<=": return v <= t
-    if op == "<": return v < t
-    return None
+    fn = _OPS.get(op)
+    return fn(v, t) if fn else None
 
 # ---------------- main ----------------
 
@@ -104,10 +116,9 @@ def main():
 
     metrics = _build_metric_lookup(summary, proxy, comps, risk, ticker)
 
-    total_w = 0
-    pass_w = 0
     rows = []
-
+    pass_w = 0.0
+    total_w = 0.0
     for c in thesis["claims"]:
         total_w += c["weight"]
         actual = metrics.get(c["metric"])
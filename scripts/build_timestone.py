@@ -77,15 +77,16 @@ def _latest_nonnull(df, col):
 def _table_rows(df, cols, n=8):
     if df is None or df.empty:
         return []
-    view = df.tail(n).copy()
+    view = df.tail(n)
+    # plain tuples + positional picks instead of a Series (and label lookups) per row;
+    # a missing column reads as None, like r.get() did
+    pos = {c: i for i, c in enumerate(view.columns)}
+    picks = [pos.get(c) for c in ["period_end", *cols]]
     rows = []
-    for _, r in view.iterrows():
-        pe = r.get("period_end")
+    for tup in view.itertuples(index=False, name=None):
+        pe, *vals = [None if i is None else tup[i] for i in picks]
         pe_str = pe.strftime("%Y-%m-%d") if hasattr(pe, "strftime") else str(pe)
-        out = [pe_str]
-        for c in cols:
-            out.append(r.get(c))
-        rows.append(out)
+        rows.append([pe_str, *vals])
     return rows
 
 def _html_table(title, subtitle, headers, rows, formatters):
@@ -108,6 +108,15 @@ def _unit_for_key(schema: dict, k: str) -> str:
         return "usd"
     return "num"
 
+_FMT_BY_UNIT = {
+    "usd": _fmt_usd,
+    "pct": _fmt_pct,
+    "x": _fmt_x,
+    "count": _fmt_count,
+    "score": _fmt_score,
+    "num": _fmt_num,
+}
+
 def _fmt_by_unit(unit: str, v):
     if v is None:
         return "N/A"
@@ -116,12 +125,7 @@ def _fmt_by_unit(unit: str, v):
     except Exception:
         return str(v)
 
-    if unit == "usd":   return _fmt_usd(fv)
-    if unit == "pct":   return _fmt_pct(fv)
-    if unit == "x":     return _fmt_x(fv)
-    if unit == "count": return _fmt_count(fv)
-    if unit == "score": return _fmt_score(fv)
-    return _fmt_num(fv)
+    return _FMT_BY_UNIT.get(unit, _fmt_num)(fv)
 
 def main(ticker: str):
     T = ticker.upper()
@@ -67,15 +67,13 @@ def main(ticker: str):
         except Exception as e:
             urls.append({"query": q, "error": str(e)})
 
-    # De-dupe by link
-    seen = set()
-    uniq = []
+    # De-dupe by link (first wins; dicts keep insertion order)
+    first = {}
     for it in all_items:
         k = it.get("link") or it.get("title")
-        if not k or k in seen:
-            continue
-        seen.add(k)
-        uniq.append(it)
+        if k:
+            first.setdefault(k, it)
+    uniq = list(first.values())
 
     out = {
         "ticker": T,
@@ -70,6 +70,14 @@ def _fmt_num(v: float) -> str:
         return f"{v:.1f}"
     return f"{v:.2f}"
 
+_FORMATTERS = {
+    "usd": _fmt_usd,
+    "pct": _fmt_pct,
+    "x": _fmt_x,
+    "count": _fmt_count,
+    "num": _fmt_num,
+}
+
 def fmt(key: str, value: Any) -> str:
     if value is None:
         return "N/A"
@@ -85,17 +93,9 @@ def fmt(key: str, value: Any) -> str:
     except Exception:
         return str(value)
 
-    if unit == "usd":
-        return _fmt_usd(v)
-    if unit == "pct":
-        return _fmt_pct(v)
-    if unit == "x":
-        return _fmt_x(v)
-    if unit == "count":
-        return _fmt_count(v)
     if unit == "date":
         return str(value)
-    return _fmt_num(v)
+    return _FORMATTERS.get(unit, _fmt_num)(v)
 
 def label(key: str) -> str:
     # Simple prettifier: fcf_ttm -> FCF TTM
@@ -147,15 +147,11 @@ def build_default_claims(thesis_text: str) -> List[Claim]:
         ]
 
     # Keep it sane
-    # Deduplicate by id
-    seen = set()
-    out = []
+    # Deduplicate by id (first wins; dicts keep insertion order)
+    first: Dict[str, Claim] = {}
     for c in claims:
-        if c.id in seen:
-            continue
-        seen.add(c.id)
-        out.append(c)
-    return out
+        first.setdefault(c.id, c)
+    return list(first.values())
 
 
 def write_thesis_file(ticker: str, thesis_text: str) -> Path:
@@ -1,11 +1,10 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import csv
 import json
 from pathlib import Path
-from typing import Any, Dict, Optional
-
-import pandas as pd
+from typing import Any, Dict, Iterable, Iterator, Optional
 
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -18,19 +17,56 @@ import argparse
 
 
 
-def safe_read_csv(path: Path) -> pd.DataFrame:
+# Only the columns build_metrics_snapshot reads, per processed file.
+FUNDAMENTALS_COLS = ("period_end", "revenue_yoy_pct", "free_cash_flow", "fcf_margin_pct", "cash", "debt")
+COMPS_COLS = ("ticker", "price", "market_cap", "fcf_yield")
+PROXY_COLS = ("ticker", "shock_30d", "neg_30d", "articles_30d", "proxy_score_30d")
+RISK_COLS = ("ticker", "risk_tag", "neg_count_30d")
+
+
+def iter_csv_rows(path: Path, fields: Iterable[str]) -> Iterator[Dict[str, Optional[str]]]:
+    """Stream rows as dicts of just `fields`; a missing or unreadable file yields nothing."""
     try:
-        return pd.read_csv(path)
-    except Exception:
-        return pd.DataFrame()
+        with open(path, newline="", encoding="utf-8") as fh:
+            reader = csv.reader(fh)
+            header = next(reader, None)
+            if header is None:
+                return
+            wanted = set(fields)
+            keep = [(i, c) for i, c in enumerate(header) if c in wanted]
+            for r in reader:
+                if r:  # DictReader skips blank lines too
+                    yield {c: r[i] if i < len(r) else None for i, c in keep}
+    except (OSError, csv.Error):
+        return
+
+
+def first_row_for_ticker(path: Path, ticker: str, fields: Iterable[str]) -> Dict[str, Optional[str]]:
+    t = ticker.upper()
+    for row in iter_csv_rows(path, fields):
+        if str(row.get("ticker")).upper() == t:
+            return row
+    return {}
 
 
 def coerce_float(x: Any) -> Optional[float]:
-    try:
-        if x is None:
+    # fast paths first: most values are already numbers or CSV strings
+    t = type(x)
+    if t is float:
+        return x
+    if t is int:
+        return float(x)
+    if x is None:
+        return None
+    if t is str:
+        s = x.strip()
+        if not s:
             return None
-        if isinstance(x, str) and x.strip() == "":
+        try:
+            return float(s)
+        except ValueError:
             return None
+    try:
         return float(x)
     except Exception:
         return None
@@ -47,13 +83,12 @@ def build_metrics_snapshot(ticker: str) -> Dict[str, Any]:
     """
     out: Dict[str, Any] = {}
 
-    # Annual fundamentals history
-    f = safe_read_csv(DATA_PROCESSED / "fundamentals_annual_history.csv")
-    if not f.empty:
-        if "period_end" in f.columns:
-            f = f.sort_values("period_end")
-        last = f.iloc[-1]
-
+    # Annual fundamentals history (single pass, keep the latest period_end)
+    last = None
+    for row in iter_csv_rows(DATA_PROCESSED / "fundamentals_annual_history.csv", FUNDAMENTALS_COLS):
+        if last is None or (row.get("period_end") or "") >= (last.get("period_end") or ""):
+            last = row
+    if last is not None:
         out["latest_period_end"] = last.get("period_end")
         out["latest_revenue_yoy_pct"] = last.get("revenue_yoy_pct")
         out["latest_free_cash_flow"] = last.get("free_cash_flow")
@@ -70,45 +105,39 @@ def build_metrics_snapshot(ticker: str) -> Dict[str, Any]:
                 out["latest_net_debt_to_fcf"] = (debt - cash) / fcf
 
     # Comps snapshot (valuation)
-    comps = safe_read_csv(DATA_PROCESSED / "comps_snapshot.csv")
-    if not comps.empty and "ticker" in comps.columns:
-        r = comps[comps["ticker"].astype(str).str.upper() == ticker.upper()]
-        if not r.empty:
-            row = r.iloc[0].to_dict()
-            out["price"] = row.get("price")
-            out["market_cap"] = row.get("market_cap")
-            fy = row.get("fcf_yield")
-            if fy is not None:
-                try:
-                    out["fcf_yield_pct"] = float(fy) * 100.0
-                except Exception:
-                    out["fcf_yield_pct"] = fy
+    row = first_row_for_ticker(DATA_PROCESSED / "comps_snapshot.csv", ticker, COMPS_COLS)
+    if row:
+        out["price"] = row.get("price")
+        out["market_cap"] = row.get("market_cap")
+        fy = coerce_float(row.get("fcf_yield"))
+        if fy is not None:
+            out["fcf_yield_pct"] = fy * 100.0
 
     # News proxy
-    proxy = safe_read_csv(DATA_PROCESSED / "news_sentiment_proxy.csv")
-    if not proxy.empty and "ticker" in proxy.columns:
-        r = proxy[proxy["ticker"].astype(str).str.upper() == ticker.upper()]
-        if not r.empty:
-            row = r.iloc[0].to_dict()
-            out["news_shock_30d"] = row.get("shock_30d")
-            out["news_neg_30d"] = row.get("neg_30d")
-            out["news_articles_30d"] = row.get("articles_30d")
-            out["news_proxy_score_30d"] = row.get("proxy_score_30d")
-
-    # Risk dashboard (tag counts) — normalize + fill missing
-    risk = safe_read_csv(DATA_PROCESSED / "news_risk_dashboard.csv")
-    if not risk.empty and "ticker" in risk.columns:
-        rd = risk[risk["ticker"].astype(str).str.upper() == ticker.upper()].copy()
-        if not rd.empty and "risk_tag" in rd.columns:
-            alias = {
-                "LABOUR": "LABOR",
-                "WORKFORCE": "LABOR",
-                "EMPLOYMENT": "LABOR",
-            }
-            for _, rr in rd.iterrows():
-                raw_tag = str(rr.get("risk_tag", "OTHER")).strip().upper()
-                tag = alias.get(raw_tag, raw_tag)
-                out[f"risk_{tag.lower()}_neg_30d"] = rr.get("neg_count_30d")
+    row = first_row_for_ticker(DATA_PROCESSED / "news_sentiment_proxy.csv", ticker, PROXY_COLS)
+    if row:
+        out["news_shock_30d"] = row.get("shock_30d")
+        out["news_neg_30d"] = row.get("neg_30d")
+        out["news_articles_30d"] = row.get("articles_30d")
+        out["news_proxy_score_30d"] = row.get("proxy_score_30d")
+
+    # Risk dashboard (tag counts) — normalize + fill missing, accumulated while streaming
+    alias = {
+        "LABOUR": "LABOR",
+        "WORKFORCE": "LABOR",
+        "EMPLOYMENT": "LABOR",
+    }
+    t = ticker.upper()
+    keys: Dict[str, str] = {}  # raw tag -> metric key, normalized once per distinct tag
+    for rr in iter_csv_rows(DATA_PROCESSED / "news_risk_dashboard.csv", RISK_COLS):
+        if str(rr.get("ticker")).upper() != t:
+            continue
+        raw = rr.get("risk_tag") or "OTHER"
+        key = keys.get(raw)
+        if key is None:
+            tag = str(raw).strip().upper()
+            key = keys[raw] = f"risk_{alias.get(tag, tag).lower()}_neg_30d"
+        out[key] = rr.get("neg_count_30d")
 
     # Ensure common tags exist (prevents UNKNOWN)
     for t in ["insurance", "regulatory", "labor", "safety"]:
@@ -246,10 +246,8 @@ class DecisionOutput:
 
 
 def compute_decision_with_peers_and_news(comps: pd.DataFrame, news_summary: dict, news_proxy_row: dict) -> DecisionOutput:
-    df = comps.copy()
-    df["ticker"] = df["ticker"].astype(str).str.upper()
-
-    row = df[df["ticker"] == PRIMARY]
+    # read-only below: mask on an upper-cased view instead of copying comps to rewrite "ticker"
+    row = comps[comps["ticker"].astype(str).str.upper() == PRIMARY]
     if row.empty:
         raise RuntimeError(f"{PRIMARY} not found in comps snapshot")
     r = row.iloc[0]
@@ -263,10 +261,10 @@ def compute_decision_with_peers_and_news(comps: pd.DataFrame, news_summary: dict
     margin = _safe_float(r.get("fcf_margin_ttm_pct"))
     nd_fcf = _safe_float(r.get("net_debt_to_fcf_ttm"))
 
-    rank_fcf_yield = _rank_percentile(df["fcf_yield"], fcf_yield, higher_is_better=True)
-    rank_rev_yoy = _rank_percentile(df["revenue_ttm_yoy_pct"], rev_yoy, higher_is_better=True)
-    rank_fcf_yoy = _rank_percentile(df["fcf_ttm_yoy_pct"], fcf_yoy, higher_is_better=True)
-    rank_margin = _rank_percentile(df["fcf_margin_ttm_pct"], margin, higher_is_better=True)
+    rank_fcf_yield = _rank_percentile(comps["fcf_yield"], fcf_yield, higher_is_better=True)
+    rank_rev_yoy = _rank_percentile(comps["revenue_ttm_yoy_pct"], rev_yoy, higher_is_better=True)
+    rank_fcf_yoy = _rank_percentile(comps["fcf_ttm_yoy_pct"], fcf_yoy, higher_is_better=True)
+    rank_margin = _rank_percentile(comps["fcf_margin_ttm_pct"], margin, higher_is_better=True)
 
     peer_ranks = {
         "fcf_yield_pct_rank": rank_fcf_yield,
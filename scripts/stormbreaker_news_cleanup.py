@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import argparse
+import re
 from pathlib import Path
 from urllib.parse import urlparse
 
@@ -16,6 +17,13 @@ def domain_of(url: str) -> str:
     except Exception:
         return ""
 
+# netloc as urlparse sees it: everything between "//" and the next / ? #
+_NETLOC_RE = re.compile(r"^(?:[a-z][a-z0-9+.\-]*:)?//([^/?#]*)")
+
+def domains_of(urls: pd.Series) -> pd.Series:
+    """Column version of domain_of: one compiled regex run by pandas' .str kernels."""
+    return urls.astype(str).str.lstrip().str.lower().str.extract(_NETLOC_RE, expand=False).fillna("")
+
 def load_whitelist_domains() -> set[str]:
     wl = ROOT / "export" / "source_whitelist.csv"
     if not wl.exists():
@@ -29,18 +37,22 @@ def load_whitelist_domains() -> set[str]:
     except Exception:
         return set()
 
+# Keep conservative (you can tune later)
+_SOURCE_WEIGHTS = {
+    "sec": 3.0,
+    "reuters": 2.5, "bloomberg": 2.5, "wsj": 2.5, "ft": 2.5,
+    "cnbc": 1.6,
+    "finnhub": 0.7,
+}
+_DEFAULT_SOURCE_WEIGHT = 0.6
+
 def source_weight(source: str) -> float:
-    # Keep conservative (you can tune later)
-    s = (source or "").strip().lower()
-    if s == "sec":
-        return 3.0
-    if s in {"reuters","bloomberg","wsj","ft"}:
-        return 2.5
-    if s in {"cnbc"}:
-        return 1.6
-    if s in {"finnhub"}:
-        return 0.7
-    return 0.6
+    return _SOURCE_WEIGHTS.get((source or "").strip().lower(), _DEFAULT_SOURCE_WEIGHT)
+
+def source_weights(sources: pd.Series) -> pd.Series:
+    # column version of source_weight: hashed .map instead of a Python call per row
+    s = sources.fillna("").astype(str).str.strip().str.lower()
+    return s.map(_SOURCE_WEIGHTS).fillna(_DEFAULT_SOURCE_WEIGHT)
 
 def main(ticker: str):
     in_path = PROCESSED / "news_unified.csv"
@@ -61,8 +73,8 @@ def main(ticker: str):
         print(f"No rows for {ticker} in news_unified.csv. Skipping.")
         return
 
-    df["domain"] = df.get("url", "").apply(domain_of)
-    df["src_weight"] = df.get("source", "").apply(source_weight)
+    df["domain"] = domains_of(df["url"]) if "url" in df.columns else ""
+    df["src_weight"] = source_weights(df["source"]) if "source" in df.columns else _DEFAULT_SOURCE_WEIGHT
 
     whitelist = load_whitelist_domains()
     df["whitelisted"] = df["domain"].isin(whitelist)
@@ -76,9 +88,12 @@ def main(ticker: str):
     if "dedupe_key" in df.columns:
         df = df.sort_values(["trust_score"], ascending=False).drop_duplicates(subset=["dedupe_key"], keep="first")
     else:
-        df["published_day"] = df.get("published_at", "").astype(str).str.slice(0, 10)
-        df["title_norm"] = df.get("title", "").astype(str).str.lower().str.replace(r"\W+", " ", regex=True).str.strip()
-        df = df.sort_values(["trust_score"], ascending=False).drop_duplicates(subset=["published_day","title_norm"], keep="first")
+        df = df.sort_values(["trust_score"], ascending=False)
+        published_day = df.get("published_at", "").astype(str).str.slice(0, 10)
+        title_norm = df.get("title", "").astype(str).str.lower().str.replace(r"\W+", " ", regex=True).str.strip()
+        # hash (day, title) pairs instead of adding two helper columns to the frame
+        key = pd.util.hash_pandas_object(pd.concat([published_day, title_norm], axis=1), index=False)
+        df = df[~key.duplicated(keep="first").to_numpy()]
 
     # Keep most useful columns and sort newest first
     cols = [c for c in [